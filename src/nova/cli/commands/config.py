@@ -10,6 +10,7 @@ import yaml
 from nova.config import ConfigError, FileConfigStore
 from nova.settings import settings
 from nova.utils.functools.models import Err, Ok
+from nova.utils.yaml import YamlDumper
 
 FormatOption = Annotated[
     Literal["yaml", "json"],
@@ -56,7 +57,7 @@ def show(
 def _format_payload(payload: dict[str, object], format: str) -> str:
     if format == "json":
         return json.dumps(payload, indent=2, sort_keys=True)
-    return yaml.safe_dump(payload, sort_keys=True)
+    return yaml.dump(payload, Dumper=YamlDumper, sort_keys=True)
 
 
 def _handle_error(error: ConfigError) -> None:
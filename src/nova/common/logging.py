@@ -7,7 +7,7 @@ This module provides logging configuration for both CLI and library usage:
 
 import sys
 from pathlib import Path
-from typing import Literal
+from typing import Final, Literal
 
 import loguru
 from loguru import logger
@@ -18,6 +18,10 @@ from nova.constants import APP_NAME
 from .models import AppDirectories, AppInfo
 from .paths import get_data_directory_from_dirs
 
+_TEXT_FORMAT: Final = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message} | {extra}\n{exception}"
+)
+
 
 class LoggingConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -54,7 +58,7 @@ def setup_cli_logging(app_info: AppInfo, config: LoggingConfig, directories: App
             level=config.log_level,
             rotation=config.rotation,
             retention=config.retention,
-            format=_get_text_format(),
+            format=_TEXT_FORMAT,
             diagnose=(app_info.environment == "dev"),
         )
 
@@ -79,7 +83,7 @@ def enable_library_logging(level: str = "INFO") -> int:
     handler_id = logger.add(
         sys.stderr,
         level=level,
-        format=_get_text_format(),
+        format=_TEXT_FORMAT,
         colorize=False,
     )
 
@@ -90,10 +94,6 @@ def create_logger(scope: str) -> "loguru.Logger":
     return logger.bind(scope=scope)
 
 
-def _get_text_format() -> str:
-    return "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message} | {extra}\n{exception}"
-
-
 def _get_default_log_file_path(directories: AppDirectories) -> Path:
     data_dir = get_data_directory_from_dirs(directories)
     logs_dir = data_dir / "logs"
@@ -5,26 +5,36 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from nova.constants import APP_NAME
+from nova.constants import (
+    APP_NAME,
+    CONFIG_FILENAME,
+    MARKETPLACES_DIR_NAME,
+    MARKETPLACES_METADATA_FILENAME,
+    USER_CONFIG_FILENAME,
+)
 
 
 class AppInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     project_name: str = APP_NAME
     version: str = "0.1.0"
     environment: Literal["test", "dev", "prod"] = "dev"
 
 
 class AppPaths(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     config_dir_name: str = APP_NAME
     data_dir_name: str = APP_NAME
     project_subdir_name: str = f".{APP_NAME}"
-    global_config_filename: str = "config.yaml"
-    project_config_filename: str = "config.yaml"
-    user_config_filename: str = "config.local.yaml"
-    marketplaces_dir_name: str = "marketplaces"
-    marketplaces_metadata_filename: str = "data.json"
+    global_config_filename: str = CONFIG_FILENAME
+    project_config_filename: str = CONFIG_FILENAME
+    user_config_filename: str = USER_CONFIG_FILENAME
+    marketplaces_dir_name: str = MARKETPLACES_DIR_NAME
+    marketplaces_metadata_filename: str = MARKETPLACES_METADATA_FILENAME
 
 
 @dataclass(frozen=True)
@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 from .models import AppDirectories
 
 
 def resolve_working_directory(working_dir: Path | None) -> Path:
-    base = working_dir or Path.cwd()
-    if base.is_file():
-        base = base.parent
+    base = os.fspath(working_dir) if working_dir is not None else os.getcwd()
+    if os.path.isfile(base):
+        base = os.path.dirname(base) or os.curdir
     try:
-        return base.resolve(strict=False)
+        return Path(os.path.realpath(base))
     except OSError:
-        return base
+        return Path(base)
 
 
 def get_global_config_root(directories: AppDirectories) -> Path:
@@ -23,9 +25,7 @@ def get_global_config_root(directories: AppDirectories) -> Path:
 
     Returns ~/.config/{app_name} (or XDG_CONFIG_HOME/{app_name} if set).
     """
-    xdg_base = os.getenv("XDG_CONFIG_HOME")
-    base_dir = Path(xdg_base).expanduser() if xdg_base else Path.home() / ".config"
-    return base_dir / directories.app_name
+    return _global_config_root(directories.app_name, os.getenv("XDG_CONFIG_HOME"), os.getenv("HOME"))
 
 
 def get_project_root(start_dir: Path | None, directories: AppDirectories) -> Path | None:
@@ -38,16 +38,14 @@ def get_project_root(start_dir: Path | None, directories: AppDirectories) -> Pat
     Returns:
         Path to project root, or None if not found
     """
-    if start_dir is None:
-        start_dir = Path.cwd()
-    if start_dir.is_file():
-        start_dir = start_dir.parent
+    start = os.fspath(start_dir) if start_dir is not None else os.getcwd()
+    if os.path.isfile(start):
+        start = os.path.dirname(start)
 
     marker = directories.project_marker
-    for path in [start_dir, *start_dir.parents]:
-        candidate = path / marker
-        if candidate.is_dir():
-            return path
+    for path in _iter_ancestors(start):
+        if os.path.isdir(os.path.join(path, marker)):
+            return Path(path)
     return None
 
 
@@ -72,6 +70,29 @@ def get_data_directory_from_dirs(directories: AppDirectories) -> Path:
 
     Returns ~/.local/share/{app_name} (or XDG_DATA_HOME/{app_name} if set).
     """
-    xdg_data = os.getenv("XDG_DATA_HOME")
-    base_dir = Path(xdg_data).expanduser() if xdg_data else Path.home() / ".local" / "share"
-    return base_dir / directories.app_name
+    return _data_directory(directories.app_name, os.getenv("XDG_DATA_HOME"), os.getenv("HOME"))
+
+
+@lru_cache(maxsize=8)
+def _global_config_root(app_name: str, xdg_base: str | None, home: str | None) -> Path:
+    base_dir = Path(xdg_base).expanduser() if xdg_base else _home_directory(home) / ".config"
+    return base_dir / app_name
+
+
+@lru_cache(maxsize=8)
+def _data_directory(app_name: str, xdg_data: str | None, home: str | None) -> Path:
+    base_dir = Path(xdg_data).expanduser() if xdg_data else _home_directory(home) / ".local" / "share"
+    return base_dir / app_name
+
+
+def _home_directory(home: str | None) -> Path:
+    return Path(home) if home else Path.home()
+
+
+def _iter_ancestors(path: str) -> Iterator[str]:
+    while True:
+        yield path
+        parent = os.path.dirname(path) or os.curdir
+        if parent == path:
+            return
+        path = parent
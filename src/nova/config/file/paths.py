@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
-from nova.common import get_global_config_root, get_project_root, resolve_project_dir, resolve_working_directory
+from nova.common import get_global_config_root, get_project_root, resolve_working_directory
 
 from .settings import ConfigStoreSettings
 
@@ -30,8 +31,8 @@ def discover_config_paths(working_dir: Path, settings: ConfigStoreSettings) -> R
 
 
 def _resolve_global_config(settings: ConfigStoreSettings) -> Path | None:
-    candidate = get_global_config_root(settings.directories) / settings.global_file
-    return candidate if candidate.is_file() else None
+    (global_path,) = _find_files(get_global_config_root(settings.directories), settings.global_file)
+    return global_path
 
 
 def _resolve_project_configs(
@@ -41,14 +42,16 @@ def _resolve_project_configs(
     if project_root is None:
         return None, None
 
-    project_dir = resolve_project_dir(project_root, settings.directories)
-    if project_dir is None:
-        return None, None
+    project_dir = project_root / settings.project_marker
+    project_path, user_path = _find_files(project_dir, settings.project_file, settings.user_file)
+    return project_path, user_path
 
-    project_candidate = project_dir / settings.project_file
-    user_candidate = project_dir / settings.user_file
 
-    project_path = project_candidate if project_candidate.is_file() else None
-    user_path = user_candidate if user_candidate.is_file() else None
+def _find_files(directory: Path, *names: str) -> list[Path | None]:
+    try:
+        with os.scandir(directory) as it:
+            entries = {entry.name: entry for entry in it if entry.name in names}
+    except OSError:
+        return [None] * len(names)
 
-    return project_path, user_path
+    return [directory / name if name in entries and entries[name].is_file() else None for name in names]
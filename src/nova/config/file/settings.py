@@ -5,9 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from nova.common import AppDirectories
+from nova.constants import CONFIG_FILENAME, USER_CONFIG_FILENAME
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigFileNames:
     """Config file naming convention.
 
@@ -17,12 +18,12 @@ class ConfigFileNames:
         user_file: Filename for user-specific config (.nova/)
     """
 
-    global_file: str = "config.yaml"
-    project_file: str = "config.yaml"
-    user_file: str = "config.local.yaml"
+    global_file: str = CONFIG_FILENAME
+    project_file: str = CONFIG_FILENAME
+    user_file: str = USER_CONFIG_FILENAME
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigStoreSettings:
     """Complete settings for file-based config store."""
 
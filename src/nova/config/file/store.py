@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import stat
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from nova.common import create_logger, get_global_config_root
 from nova.marketplace import MarketplaceConfig, MarketplaceScope
@@ -15,8 +19,9 @@ from nova.marketplace.models import (
     MarketplaceSource,
 )
 from nova.utils.functools.models import Err, Ok, Result, is_err
+from nova.utils.yaml import YamlDumper, YamlLoader
 
-from ..merger import merge_configs
+from ..merger import merge_config_data
 from ..models import (
     ConfigError,
     ConfigIOError,
@@ -30,7 +35,7 @@ from ..models import (
     UserConfig,
 )
 from ..protocol import ConfigStore
-from ..resolver import apply_env_overrides
+from ..resolver import load_env_overrides
 from .paths import ResolvedConfigPaths, discover_config_paths
 from .settings import ConfigStoreSettings
 
@@ -38,16 +43,22 @@ logger = create_logger("config")
 
 ScopeModel = GlobalConfig | ProjectConfig | UserConfig
 ScopeModelType = type[GlobalConfig] | type[ProjectConfig] | type[UserConfig]
+ScopeData = dict[str, Any]
+
+_PARSED_YAML_CACHE_SIZE: Final = 32
 
 
 class FileConfigStore(ConfigStore):
     def __init__(self, settings: ConfigStoreSettings, working_dir: Path | None = None) -> None:
         self.working_dir = working_dir or Path.cwd()
         self.settings = settings
+        self._config_paths: ResolvedConfigPaths | None = None
+        self._parsed_yaml_cache: OrderedDict[str, tuple[int, int, ScopeData]] = OrderedDict()
+        self._parsed_yaml_lock = threading.Lock()
 
     def load(self) -> Result[NovaConfig, ConfigError]:
         logger.debug("Loading config", working_dir=str(self.working_dir))
-        paths = discover_config_paths(self.working_dir, self.settings)
+        paths = self._discover_paths()
 
         logger.debug(
             "Config paths discovered",
@@ -57,14 +68,13 @@ class FileConfigStore(ConfigStore):
         )
 
         return (
-            self._load_all_scopes(paths)
-            .map(lambda configs: merge_configs(configs[0], configs[1], configs[2]))
-            .map(apply_env_overrides)
+            self._load_all_scope_data(paths)
+            .map(lambda scopes: merge_config_data(*scopes, overrides=load_env_overrides()))
             .inspect_err(lambda error: logger.error("Config load failed", scope=error.scope.value, error=error.message))
         )
 
     def load_scope(self, scope: ConfigScope) -> Result[NovaConfig | None, ConfigError]:
-        paths = discover_config_paths(self.working_dir, self.settings)
+        paths = self._discover_paths()
 
         match scope:
             case ConfigScope.GLOBAL:
@@ -108,6 +118,11 @@ class FileConfigStore(ConfigStore):
             lambda marketplaces: any(m.name == name or m.source == source for m in marketplaces)
         )
 
+    def _discover_paths(self) -> ResolvedConfigPaths:
+        if self._config_paths is None:
+            self._config_paths = discover_config_paths(self.working_dir, self.settings)
+        return self._config_paths
+
     def add_marketplace(
         self,
         config: MarketplaceConfig,
@@ -116,7 +131,7 @@ class FileConfigStore(ConfigStore):
         """Add marketplace configuration to specified scope."""
         config_scope = ConfigScope.GLOBAL if scope == MarketplaceScope.GLOBAL else ConfigScope.PROJECT
 
-        load_result = self.load_scope(config_scope).map_err(
+        load_result = self._load_marketplace_scope(config_scope).map_err(
             lambda config_error: MarketplaceConfigError(
                 scope=scope.value,
                 message=f"Failed to load existing config: {config_error.message}",
@@ -125,15 +140,11 @@ class FileConfigStore(ConfigStore):
         if is_err(load_result):
             return load_result
 
-        existing_config = load_result.unwrap()
-
-        if existing_config is None:
-            marketplaces = [config.model_dump(mode="json")]
-        else:
-            marketplaces = [m.model_dump(mode="json") for m in existing_config.marketplaces]
-            marketplaces.append(config.model_dump(mode="json"))
-
-        data = {"marketplaces": marketplaces}
+        existing_data, existing_marketplaces = load_result.unwrap()
+        data = {
+            **existing_data,
+            "marketplaces": [m.model_dump(mode="json") for m in [*existing_marketplaces, config]],
+        }
 
         return self._write_scope_data(config_scope, data).map_err(
             lambda config_error: MarketplaceConfigError(
@@ -175,7 +186,7 @@ class FileConfigStore(ConfigStore):
     ) -> Result[MarketplaceConfig, MarketplaceConfigError]:
         config_scope = ConfigScope.GLOBAL if scope == MarketplaceScope.GLOBAL else ConfigScope.PROJECT
 
-        load_result = self.load_scope(config_scope).map_err(
+        load_result = self._load_marketplace_scope(config_scope).map_err(
             lambda err: MarketplaceConfigError(
                 scope=scope,
                 message=f"Failed to load existing config: {err.message}",
@@ -184,17 +195,9 @@ class FileConfigStore(ConfigStore):
         if is_err(load_result):
             return load_result
 
-        config = load_result.unwrap()
-        if not (config and config.marketplaces):
-            return Err(
-                MarketplaceConfigError(
-                    scope=scope,
-                    message=f"Marketplace '{name}' not found in {scope.value} scope",
-                )
-            )
-
+        existing_data, marketplaces = load_result.unwrap()
         index = next(
-            (i for i, m in enumerate(config.marketplaces) if m.name == name),
+            (i for i, m in enumerate(marketplaces) if m.name == name),
             None,
         )
         if index is None:
@@ -205,8 +208,11 @@ class FileConfigStore(ConfigStore):
                 )
             )
 
-        removed = config.marketplaces[index]
-        data = {"marketplaces": [m.model_dump(mode="json") for i, m in enumerate(config.marketplaces) if i != index]}
+        removed = marketplaces[index]
+        data = {
+            **existing_data,
+            "marketplaces": [m.model_dump(mode="json") for i, m in enumerate(marketplaces) if i != index],
+        }
 
         return (
             self._write_scope_data(config_scope, data)
@@ -219,8 +225,27 @@ class FileConfigStore(ConfigStore):
             .map(lambda _: removed)
         )
 
+    def _load_marketplace_scope(
+        self,
+        scope: ConfigScope,
+    ) -> Result[tuple[ScopeData, list[MarketplaceConfig]], ConfigError]:
+        paths = self._discover_paths()
+        if scope == ConfigScope.GLOBAL:
+            path, model_cls = paths.global_path, GlobalConfig
+        else:
+            path, model_cls = paths.project_path, ProjectConfig
+        if path is None:
+            return Ok(({}, []))
+
+        data_result = self._read_scope_data(path, scope)
+        if is_err(data_result):
+            return data_result
+
+        data = data_result.unwrap()
+        return self._validate_scope_data(data, path, model_cls, scope).map(lambda config: (data, config.marketplaces))
+
     def _get_config_path_for_scope(self, scope: ConfigScope) -> Path:
-        paths = discover_config_paths(self.working_dir, self.settings)
+        paths = self._discover_paths()
 
         match scope:
             case ConfigScope.GLOBAL:
@@ -248,9 +273,12 @@ class FileConfigStore(ConfigStore):
     ) -> Result[None, ConfigError]:
         config_path = self._get_config_path_for_scope(scope)
 
+        with self._parsed_yaml_lock:
+            self._parsed_yaml_cache.pop(str(config_path), None)
+        self._config_paths = None
         try:
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            config_path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+            config_path.write_text(yaml.dump(data, Dumper=YamlDumper, sort_keys=False), encoding="utf-8")
             return Ok(None)
         except OSError as exc:
             return Err(
@@ -261,31 +289,43 @@ class FileConfigStore(ConfigStore):
                 )
             )
 
-    def _load_all_scopes(
+    def _load_all_scope_data(
         self,
         paths: ResolvedConfigPaths,
-    ) -> Result[tuple[GlobalConfig | None, ProjectConfig | None, UserConfig | None], ConfigError]:
-        global_result = self._load_optional(paths.global_path, GlobalConfig, ConfigScope.GLOBAL)
+    ) -> Result[tuple[ScopeData | None, ScopeData | None, ScopeData | None], ConfigError]:
+        global_result = self._load_optional_data(paths.global_path, GlobalConfig, ConfigScope.GLOBAL)
         if is_err(global_result):
             return global_result
 
-        project_result = self._load_optional(paths.project_path, ProjectConfig, ConfigScope.PROJECT)
+        project_result = self._load_optional_data(paths.project_path, ProjectConfig, ConfigScope.PROJECT)
         if is_err(project_result):
             return project_result
 
-        user_result = self._load_optional(paths.user_path, UserConfig, ConfigScope.USER)
+        user_result = self._load_optional_data(paths.user_path, UserConfig, ConfigScope.USER)
         if is_err(user_result):
             return user_result
 
-        global_cfg = global_result.unwrap()
-        project_cfg = project_result.unwrap()
-        user_cfg = user_result.unwrap()
+        return Ok((global_result.unwrap(), project_result.unwrap(), user_result.unwrap()))
+
+    def _load_optional_data(
+        self,
+        path: Path | None,
+        model_cls: ScopeModelType,
+        scope: ConfigScope,
+    ) -> Result[ScopeData | None, ConfigError]:
+        if path is None:
+            return Ok(None)
+
+        data_result = self._read_scope_data(path, scope)
+        if is_err(data_result):
+            return data_result
 
-        assert global_cfg is None or isinstance(global_cfg, GlobalConfig)
-        assert project_cfg is None or isinstance(project_cfg, ProjectConfig)
-        assert user_cfg is None or isinstance(user_cfg, UserConfig)
+        data = data_result.unwrap()
+        validate_result = self._validate_scope_data(data, path, model_cls, scope)
+        if is_err(validate_result):
+            return validate_result
 
-        return Ok((global_cfg, project_cfg, user_cfg))
+        return Ok(data)
 
     def _load_optional(
         self,
@@ -299,27 +339,44 @@ class FileConfigStore(ConfigStore):
 
         return self._load_scope_config(path, model_cls, scope)
 
-    def _load_scope_config(
+    def _load_scope_config[M: BaseModel](
         self,
         path: Path,
-        model_cls: ScopeModelType,
+        model_cls: type[M],
         scope: ConfigScope,
-    ) -> Result[ScopeModel, ConfigError]:
+    ) -> Result[M, ConfigError]:
         """Load and validate config from YAML file."""
+        data_result = self._read_scope_data(path, scope)
+        if is_err(data_result):
+            return data_result
+
+        return self._validate_scope_data(data_result.unwrap(), path, model_cls, scope)
+
+    def _read_scope_data(self, path: Path, scope: ConfigScope) -> Result[ScopeData, ConfigError]:
         logger.debug("Loading config file", scope=scope.value, path=str(path))
 
-        if not path.exists() or not path.is_file():
-            logger.warning("Config file not found", scope=scope.value, path=str(path))
-            return Err(
-                ConfigNotFoundError(
-                    scope=scope,
-                    expected_path=path,
-                    message=f"Configuration file not found for scope '{scope.value}'.",
-                ),
-            )
+        try:
+            file_stat = path.stat()
+        except OSError:
+            file_stat = None
+
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            return self._scope_file_not_found(path, scope)
+
+        cache_key = str(path)
+        with self._parsed_yaml_lock:
+            cached = self._parsed_yaml_cache.get(cache_key)
+            if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+                self._parsed_yaml_cache.move_to_end(cache_key)
+            else:
+                cached = None
+        if cached is not None:
+            return Ok(copy.deepcopy(cached[2]))
 
         try:
-            raw_text = path.read_text(encoding="utf-8")
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return self._scope_file_not_found(path, scope)
         except OSError as exc:
             logger.error("Config file read error", scope=scope.value, path=str(path), error=str(exc))
             return Err(
@@ -330,8 +387,21 @@ class FileConfigStore(ConfigStore):
                 ),
             )
 
+        parse_result = self._parse_scope_yaml(raw, path, scope)
+        if is_err(parse_result):
+            return parse_result
+
+        data = parse_result.unwrap()
+        with self._parsed_yaml_lock:
+            self._parsed_yaml_cache[cache_key] = (file_stat.st_mtime_ns, file_stat.st_size, data)
+            self._parsed_yaml_cache.move_to_end(cache_key)
+            if len(self._parsed_yaml_cache) > _PARSED_YAML_CACHE_SIZE:
+                self._parsed_yaml_cache.popitem(last=False)
+        return Ok(copy.deepcopy(data))
+
+    def _parse_scope_yaml(self, raw: bytes, path: Path, scope: ConfigScope) -> Result[ScopeData, ConfigError]:
         try:
-            data = yaml.safe_load(raw_text)
+            data = yaml.load(raw, Loader=YamlLoader)
         except yaml.YAMLError as exc:
             mark = getattr(exc, "problem_mark", None)
             line = getattr(mark, "line", None)
@@ -355,18 +425,41 @@ class FileConfigStore(ConfigStore):
             )
 
         if data is None:
-            data = {}
+            return Ok({})
+        if not isinstance(data, dict):
+            return self._non_mapping_root(path, scope)
+        return Ok(data)
+
+    def _scope_file_not_found(self, path: Path, scope: ConfigScope) -> Err[ConfigError]:
+        logger.warning("Config file not found", scope=scope.value, path=str(path))
+        return Err(
+            ConfigNotFoundError(
+                scope=scope,
+                expected_path=path,
+                message=f"Configuration file not found for scope '{scope.value}'.",
+            ),
+        )
 
+    def _non_mapping_root(self, path: Path, scope: ConfigScope) -> Err[ConfigError]:
+        logger.error("Config must be a mapping", scope=scope.value, path=str(path))
+        return Err(
+            ConfigValidationError(
+                scope=scope,
+                path=path,
+                field=None,
+                message="Configuration root must be a mapping of keys to values.",
+            ),
+        )
+
+    def _validate_scope_data[M: BaseModel](
+        self,
+        data: object,
+        path: Path,
+        model_cls: type[M],
+        scope: ConfigScope,
+    ) -> Result[M, ConfigError]:
         if not isinstance(data, dict):
-            logger.error("Config must be a mapping", scope=scope.value, path=str(path))
-            return Err(
-                ConfigValidationError(
-                    scope=scope,
-                    path=path,
-                    field=None,
-                    message="Configuration root must be a mapping of keys to values.",
-                ),
-            )
+            return self._non_mapping_root(path, scope)
 
         try:
             model = model_cls.model_validate(data)
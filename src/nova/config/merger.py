@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from nova.common import create_logger
@@ -24,28 +24,42 @@ def merge_configs(
     user_cfg: UserConfig | None,
 ) -> NovaConfig:
     """Merge configs with precedence: user > project > global."""
-    scopes_present = []
-    if global_cfg is not None:
-        scopes_present.append("global")
-    if project_cfg is not None:
-        scopes_present.append("project")
-    if user_cfg is not None:
-        scopes_present.append("user")
+    return merge_config_data(
+        global_cfg.model_dump() if global_cfg is not None else None,
+        project_cfg.model_dump() if project_cfg is not None else None,
+        user_cfg.model_dump() if user_cfg is not None else None,
+    )
+
+
+def merge_config_data(
+    global_data: Mapping[str, Any] | None,
+    project_data: Mapping[str, Any] | None,
+    user_data: Mapping[str, Any] | None,
+    overrides: Mapping[str, object] | None = None,
+) -> NovaConfig:
+    """Merge raw scope data with precedence: overrides > user > project > global, validating once."""
+    scopes_present = [
+        name
+        for name, data in (("global", global_data), ("project", project_data), ("user", user_data))
+        if data is not None
+    ]
 
     logger.debug("Merging configs", scopes=scopes_present)
 
     merged_data: dict[str, Any] = {}
 
-    for scope in (global_cfg, project_cfg, user_cfg):
-        if scope is None:
+    for scope_data in (global_data, project_data, user_data):
+        if scope_data is None:
             continue
-        scope_data = _strip_none_dict(scope.model_dump())
         merged_data = deep_merge(
             merged_data,
-            scope_data,
+            _strip_none_dict(dict(scope_data)),
             list_merge_strategy=_config_list_merge,
         )
 
+    if overrides:
+        merged_data = deep_merge(merged_data, overrides)
+
     result = NovaConfig.model_validate(merged_data)
     logger.info("Config merged", scopes=scopes_present, config=result.model_dump(mode="json"))
     return result
@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
+import json
 import os
+from collections.abc import Mapping
 
 import yaml
 
 from nova.common import JsonDict
 from nova.constants import ENV_PREFIX
 from nova.utils.dicts import deep_merge
+from nova.utils.yaml import YamlLoader
 
 from .models import NovaConfig
 
 
 def apply_env_overrides(config: NovaConfig) -> NovaConfig:
     """Apply environment variable overrides to config."""
+    override_data = load_env_overrides()
+    if not override_data:
+        return config
+
+    merged = deep_merge(dict(config.model_dump()), override_data)
+    return NovaConfig.model_validate(merged)
+
+
+def load_env_overrides(environ: Mapping[str, str] | None = None) -> JsonDict:
+    """Collect environment variable overrides into nested config data."""
     override_data: JsonDict = {}
 
-    for key, value in os.environ.items():
+    for key, value in (os.environ if environ is None else environ).items():
         if not key.startswith(ENV_PREFIX):
             continue
         path = key[len(ENV_PREFIX) :].strip("_")
@@ -26,11 +39,7 @@ def apply_env_overrides(config: NovaConfig) -> NovaConfig:
         segments = [segment.lower() for segment in path.split("__") if segment]
         _insert_override(override_data, segments, _parse_env_value(value))
 
-    if not override_data:
-        return config
-
-    merged = deep_merge(dict(config.model_dump()), override_data)
-    return NovaConfig.model_validate(merged)
+    return override_data
 
 
 def _insert_override(data: JsonDict, path: list[str], value: object) -> None:
@@ -46,8 +55,13 @@ def _insert_override(data: JsonDict, path: list[str], value: object) -> None:
 
 
 def _parse_env_value(raw: str) -> object:
+    if raw[:1] in ("[", "{"):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
     try:
-        parsed = yaml.safe_load(raw)
+        parsed = yaml.load(raw, Loader=YamlLoader)
     except yaml.YAMLError:
         return raw
     return parsed
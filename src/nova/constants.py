@@ -1,4 +1,12 @@
 """Project-wide constants for Nova."""
 
+import sys
+from typing import Final
+
 ENV_PREFIX = "NOVA_CONFIG__"
 APP_NAME = "nova"
+
+CONFIG_FILENAME: Final = sys.intern("config.yaml")
+USER_CONFIG_FILENAME: Final = sys.intern("config.local.yaml")
+MARKETPLACES_DIR_NAME: Final = sys.intern("marketplaces")
+MARKETPLACES_METADATA_FILENAME: Final = sys.intern("data.json")
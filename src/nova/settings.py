@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from nova.common import AppDirectories, AppInfo, AppPaths
@@ -17,23 +18,31 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         nested_model_default_partial_update=True,
+        frozen=True,
     )
 
+    _app_directories: AppDirectories | None = PrivateAttr(default=None)
+    _config_store_settings: ConfigStoreSettings | None = PrivateAttr(default=None)
+
     def to_app_directories(self) -> AppDirectories:
-        return AppDirectories(
-            app_name=self.paths.config_dir_name,
-            project_marker=self.paths.project_subdir_name,
-        )
+        if self._app_directories is None:
+            self._app_directories = AppDirectories(
+                app_name=self.paths.config_dir_name,
+                project_marker=self.paths.project_subdir_name,
+            )
+        return self._app_directories
 
     def to_config_store_settings(self) -> ConfigStoreSettings:
-        return ConfigStoreSettings(
-            directories=self.to_app_directories(),
-            filenames=ConfigFileNames(
-                global_file=self.paths.global_config_filename,
-                project_file=self.paths.project_config_filename,
-                user_file=self.paths.user_config_filename,
-            ),
-        )
+        if self._config_store_settings is None:
+            self._config_store_settings = ConfigStoreSettings(
+                directories=self.to_app_directories(),
+                filenames=ConfigFileNames(
+                    global_file=self.paths.global_config_filename,
+                    project_file=self.paths.project_config_filename,
+                    user_file=self.paths.user_config_filename,
+                ),
+            )
+        return self._config_store_settings
 
 
 def get_settings() -> Settings:
@@ -17,17 +17,21 @@ def deep_merge(
 ) -> dict[str, object]:
     """Recursively merge two mappings, giving precedence to override."""
     result: dict[str, object] = dict(base)
+    if not override:
+        return result
+
+    result_get = result.get
 
     for key, override_value in override.items():
         if override_value is None:
             continue
 
-        existing_value = result.get(key)
+        existing_value = result_get(key)
 
         if isinstance(existing_value, Mapping) and isinstance(override_value, Mapping):
             result[key] = deep_merge(
-                dict(existing_value),
-                dict(override_value),
+                existing_value,
+                override_value,
                 list_merge_strategy=list_merge_strategy,
             )
         elif isinstance(existing_value, list) and isinstance(override_value, list):
@@ -9,8 +9,10 @@ from .result import (
     as_result,
     do,
     do_async,
+    identity,
     is_err,
     is_ok,
+    partition,
 )
 
 __all__ = [
@@ -24,6 +26,8 @@ __all__ = [
     "as_result",
     "do",
     "do_async",
+    "identity",
     "is_err",
     "is_ok",
+    "partition",
 ]
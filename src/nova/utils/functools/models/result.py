@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import functools
-import inspect
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterable, Iterator
 from typing import (
     Any,
     Final,
@@ -12,6 +11,7 @@ from typing import (
     ParamSpec,
     TypeIs,
     TypeVar,
+    final,
 )
 
 ################################################################
@@ -27,7 +27,21 @@ P = ParamSpec("P")
 R = TypeVar("R")
 TBE = TypeVar("TBE", bound=BaseException)
 
+_OK_HASH_SALT: Final = 0x9E3779B97F4A7C15
+_ERR_HASH_SALT: Final = 0x8F1BBCDCBFA56B43
 
+
+def identity(value: U) -> U:
+    """
+    Return `value` unchanged.
+
+    `Ok.map` and `Err.map_err` recognise this function and return the original
+    result instead of wrapping the same value in a new instance.
+    """
+    return value
+
+
+@final
 class Ok(Generic[T]):
     """
     A value that indicates success and which stores arbitrary data for the return value.
@@ -48,11 +62,8 @@ class Ok(Generic[T]):
     def __eq__(self, other: Any) -> bool:  # noqa: ANN401
         return isinstance(other, Ok) and self._value == other._value
 
-    def __ne__(self, other: Any) -> bool:  # noqa: ANN401
-        return not (self == other)
-
     def __hash__(self) -> int:
-        return hash((True, self._value))
+        return hash(self._value) ^ _OK_HASH_SALT
 
     def is_ok(self) -> Literal[True]:
         """
@@ -343,6 +354,8 @@ class Ok(Generic[T]):
         assert x.map(lambda s: s.upper()).unwrap_err() == "error"
         ```
         """
+        if op is identity:
+            return self  # type: ignore[return-value]
         return Ok(op(self._value))
 
     async def map_async(self, op: Callable[[T], Awaitable[U]]) -> Ok[U]:
@@ -460,6 +473,8 @@ class Ok(Generic[T]):
         assert Ok(-5).and_then(validate_positive).and_then(square).unwrap_err() == "negative number"
         ```
         """
+        if op is Ok:
+            return self  # type: ignore[return-value]
         return op(self._value)
 
     async def and_then_async(self, op: Callable[[T], Awaitable[Result[U, E]]]) -> Result[U, E]:
@@ -536,6 +551,17 @@ class DoError(Exception):
         self.err = err
 
 
+class _ErrIterator(Iterator[NoReturn]):
+    __slots__ = ("_err",)
+
+    def __init__(self, err: Err[E]) -> None:
+        self._err = err
+
+    def __next__(self) -> NoReturn:
+        raise DoError(self._err)
+
+
+@final
 class Err(Generic[E]):
     """
     A value that signifies failure and which stores arbitrary data for the error.
@@ -545,12 +571,7 @@ class Err(Generic[E]):
     __slots__ = ("_value",)
 
     def __iter__(self) -> Iterator[NoReturn]:
-        def _iter() -> Iterator[NoReturn]:
-            # Exception will be raised when the iterator is advanced, not when it's created
-            raise DoError(self)
-            yield  # This yield will never be reached, but is necessary to create a generator #pyright: ignore
-
-        return _iter()
+        return _ErrIterator(self)
 
     def __init__(self, value: E) -> None:
         self._value = value
@@ -561,11 +582,8 @@ class Err(Generic[E]):
     def __eq__(self, other: Any) -> bool:  # noqa: ANN401
         return isinstance(other, Err) and self._value == other._value
 
-    def __ne__(self, other: Any) -> bool:  # noqa: ANN401
-        return not (self == other)
-
     def __hash__(self) -> int:
-        return hash((False, self._value))
+        return hash(self._value) ^ _ERR_HASH_SALT
 
     def is_ok(self) -> Literal[False]:
         """
@@ -686,13 +704,7 @@ class Err(Generic[E]):
             assert "Failed to get value" in str(e)
         ```
         """
-        exc = UnwrapError(
-            self,
-            f"{message}: {self._value!r}",
-        )
-        if isinstance(self._value, BaseException):
-            raise exc from self._value
-        raise exc
+        _raise_unwrap_error(self, message)
 
     def expect_err(self, _: str) -> E:
         """
@@ -733,13 +745,7 @@ class Err(Generic[E]):
             pass
         ```
         """
-        exc = UnwrapError(
-            self,
-            f"Called `Result.unwrap()` on an `Err` value: {self._value!r}",
-        )
-        if isinstance(self._value, BaseException):
-            raise exc from self._value
-        raise exc
+        _raise_unwrap_error(self, "Called `Result.unwrap()` on an `Err` value")
 
     def unwrap_err(self) -> E:
         """
@@ -955,6 +961,8 @@ class Err(Generic[E]):
         assert x.map_err(lambda e: f"Error: {e}").unwrap_err() == "Error: not found"
         ```
         """
+        if op is identity:
+            return self  # type: ignore[return-value]
         return Err(op(self._value))
 
     def and_then(self, _: object) -> Err[E]:
@@ -1037,6 +1045,8 @@ class Err(Generic[E]):
         assert Err("empty").or_else(fallback).map(lambda n: n * 2).unwrap() == 0
         ```
         """
+        if op is Err:
+            return self  # type: ignore[return-value]
         return op(self._value)
 
     def inspect(self, _: Callable[[T], Any]) -> Result[T, E]:
@@ -1094,6 +1104,23 @@ class UnwrapError(Exception):
         return self._result
 
 
+def _raise_unwrap_error(result: Err[object], message: str) -> NoReturn:
+    exc = UnwrapError(result, f"{message}: {result.err_value!r}")
+    if isinstance(result.err_value, BaseException):
+        raise exc from result.err_value
+    raise exc
+
+
+def _are_exception_types(exceptions: tuple[object, ...]) -> bool:
+    try:
+        return bool(exceptions) and all(
+            issubclass(exception, BaseException)  # type: ignore[arg-type]
+            for exception in exceptions
+        )
+    except TypeError:
+        return False
+
+
 def as_result(
     *exceptions: type[TBE],
 ) -> Callable[[Callable[P, R]], Callable[P, Result[R, TBE]]]:
@@ -1103,9 +1130,7 @@ def as_result(
     Regular return values are turned into ``Ok(return_value)``. Raised
     exceptions of the specified exception type(s) are turned into ``Err(exc)``.
     """
-    if not exceptions or not all(
-        inspect.isclass(exception) and issubclass(exception, BaseException) for exception in exceptions
-    ):
+    if not _are_exception_types(exceptions):
         raise TypeError("as_result() requires one or more exception types")
 
     def decorator(f: Callable[P, R]) -> Callable[P, Result[R, TBE]]:
@@ -1133,9 +1158,7 @@ def as_async_result(
     Regular return values are turned into ``Ok(return_value)``. Raised
     exceptions of the specified exception type(s) are turned into ``Err(exc)``.
     """
-    if not exceptions or not all(
-        inspect.isclass(exception) and issubclass(exception, BaseException) for exception in exceptions
-    ):
+    if not _are_exception_types(exceptions):
         raise TypeError("as_result() requires one or more exception types")
 
     def decorator(
@@ -1171,7 +1194,7 @@ def is_ok(result: Result[T, E]) -> TypeIs[Ok[T]]:
     ```
 
     """
-    return result.is_ok()
+    return type(result) is Ok
 
 
 def is_err(result: Result[T, E]) -> TypeIs[Err[E]]:
@@ -1188,7 +1211,30 @@ def is_err(result: Result[T, E]) -> TypeIs[Err[E]]:
     ```
 
     """
-    return result.is_err()
+    return type(result) is Err
+
+
+def partition(results: Iterable[Result[T, E]]) -> tuple[list[T], list[E]]:
+    """Split results into their `Ok` values and their `Err` values, preserving order.
+
+    Usage:
+
+    ``` python
+    oks, errs = partition([Ok(1), Err("a"), Ok(2)])
+    assert oks == [1, 2]
+    assert errs == ["a"]
+    ```
+    """
+    oks: list[T] = []
+    errs: list[E] = []
+    append_ok = oks.append
+    append_err = errs.append
+    for result in results:
+        if result.__class__ is Ok:
+            append_ok(result.ok_value)  # type: ignore[union-attr]
+        else:
+            append_err(result.err_value)  # type: ignore[union-attr]
+    return oks, errs
 
 
 def do(gen: Generator[Result[T, E]]) -> Result[T, E]:
@@ -1219,20 +1265,15 @@ def do(gen: Generator[Result[T, E]]) -> Result[T, E]:
     your type checker might be unable to infer the return type.
     To avoid an error, you might need to help it with the type hint.
     """
+    # Python has strange rules involving turning generators involving `await`
+    # into async generators, so we want to make sure to help the user clearly.
+    if isinstance(gen, AsyncGenerator):
+        raise TypeError("Got async_generator but expected generator.See the section on do notation in the README.")
     try:
         return next(gen)
     except DoError as e:
         out: Err[E] = e.err  # type: ignore
         return out
-    except TypeError as te:
-        # Turn this into a more helpful error message.
-        # Python has strange rules involving turning generators involving `await`
-        # into async generators, so we want to make sure to help the user clearly.
-        if "'async_generator' object is not an iterator" in str(te):
-            raise TypeError(
-                "Got async_generator but expected generator.See the section on do notation in the README."
-            ) from te
-        raise te
 
 
 async def do_async(
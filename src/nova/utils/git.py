@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import os
 import re
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 from pydantic import BaseModel
 
 from nova.utils.functools.models import Err, Ok, Result
 
+_GIT_VERSION_RE: Final = re.compile(r"git version (\d+\.\d+\.\d+)")
+
 
 class GitError(BaseModel):
     """Base error for git operations."""
@@ -35,20 +41,17 @@ class GitVersionError(GitError):
     pass
 
 
+@lru_cache(maxsize=1)
 def is_git_installed() -> bool:
-    """Check if git command is available."""
-    try:
-        subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if git command is available on PATH."""
+    return shutil.which("git") is not None
 
 
+@lru_cache(maxsize=1)
 def get_git_version() -> Result[str, GitError]:
+    if not is_git_installed():
+        return Err(GitNotInstalledError(message="git command not found"))
+
     try:
         result = subprocess.run(
             ["git", "--version"],
@@ -57,7 +60,7 @@ def get_git_version() -> Result[str, GitError]:
             check=True,
         )
 
-        if (match := re.search(r"git version (\d+\.\d+\.\d+)", result.stdout)):
+        if match := _GIT_VERSION_RE.search(result.stdout):
             return Ok(match.group(1))
 
         return Err(GitVersionError(message=f"Could not parse git version from: {result.stdout}"))
@@ -74,7 +77,7 @@ def clone_repository(
     *,
     depth: int = 1,
 ) -> Result[Path, GitError]:
-    if destination.exists():
+    if os.path.lexists(destination):
         return Err(GitCloneError(url=url, message=f"Destination already exists: {destination}"))
 
     try:
@@ -82,7 +85,8 @@ def clone_repository(
 
         subprocess.run(
             ["git", "clone", "--depth", str(depth), url, str(destination)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
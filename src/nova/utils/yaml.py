@@ -0,0 +1,12 @@
+"""YAML loader and dumper classes backed by libyaml when it is available."""
+
+from __future__ import annotations
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+__all__ = ["YamlDumper", "YamlLoader"]
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import os
 import shutil
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 import yaml
 from typer.testing import CliRunner, Result
 
+from nova.cli.commands import marketplace as marketplace_commands
 from nova.cli.main import app
+from nova.utils.yaml import YamlDumper, YamlLoader
 
 RUNNER = CliRunner()
 FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "marketplaces"
@@ -36,7 +41,7 @@ def _copy_marketplace_fixture(name: str, destination: Path) -> Path:
     src = FIXTURES_DIR / name
     if not src.exists():
         raise RuntimeError(f"Fixture '{name}' not found at {src}")
-    shutil.copytree(src, destination)
+    shutil.copytree(src, destination, copy_function=shutil.copyfile)
     return destination
 
 
@@ -47,7 +52,11 @@ def _run_git(args: list[str], *, cwd: Path | None = None) -> None:
         "GIT_COMMITTER_NAME": "Nova Tests",
         "GIT_COMMITTER_EMAIL": "nova-tests@example.com",
     }
-    subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True)
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, env=env, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.decode()}")
 
 
 def _create_github_mirror(
@@ -57,307 +66,283 @@ def _create_github_mirror(
     repo: str,
     mirror_root: Path,
 ) -> None:
-    working_repo = mirror_root / "working" / owner / repo
-    _copy_marketplace_fixture(fixture_name, working_repo)
-    _run_git(["init"], cwd=working_repo)
-    _run_git(["add", "-A"], cwd=working_repo)
-    _run_git(["commit", "-m", "Initial commit"], cwd=working_repo)
+    src = FIXTURES_DIR / fixture_name
+    if not src.exists():
+        raise RuntimeError(f"Fixture '{fixture_name}' not found at {src}")
 
     bare_repo = mirror_root / "github.com" / owner / f"{repo}.git"
     bare_repo.parent.mkdir(parents=True, exist_ok=True)
-    _run_git(["clone", "--bare", str(working_repo), str(bare_repo)])
-    _run_git(["update-server-info"], cwd=bare_repo)
+    _run_git(["init", "--bare", "--quiet", str(bare_repo)])
+    tree_args = [f"--git-dir={bare_repo}", f"--work-tree={src}"]
+    _run_git([*tree_args, "add", "-A"])
+    _run_git([*tree_args, "commit", "--quiet", "-m", "Initial commit"])
+
+
+@pytest.fixture(scope="session")
+def github_mirror(tmp_path_factory: pytest.TempPathFactory) -> str:
+    mirror_root = tmp_path_factory.mktemp("git-mirrors").resolve()
+    _create_github_mirror("valid-basic", owner="owner", repo="repo", mirror_root=mirror_root)
+    prefix = (mirror_root / "github.com").as_uri()
+    return prefix if prefix.endswith("/") else f"{prefix}/"
+
+
+@pytest.fixture
+def env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    monkeypatch.chdir(tmp_path)
+    return _create_env(tmp_path)
 
 
-def _configure_git_redirect(home: Path, mirror_root: Path) -> None:
-    prefix = (mirror_root / "github.com").resolve().as_uri()
-    if not prefix.endswith("/"):
-        prefix = f"{prefix}/"
+@pytest.fixture
+def seeded_env(env: dict[str, str]) -> dict[str, str]:
+    _seed_marketplaces(env, [FIXTURES_DIR / "valid-basic"])
+    return env
+
+
+def _configure_git_redirect(home: Path, mirror_url: str) -> None:
     gitconfig = home / ".gitconfig"
-    gitconfig.write_text(f'[url "{prefix}"]\n\tinsteadOf = https://github.com/\n')
+    gitconfig.write_text(f'[url "{mirror_url}"]\n\tinsteadOf = https://github.com/\n')
 
 
 def _read_config(path: Path) -> dict:
     if not path.exists():
         return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=YamlLoader) or {}
     return data
 
 
 def _read_datastore(path: Path) -> dict:
     if not path.exists():
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_bytes())
+
+
+def _seed_marketplaces(env: dict[str, str], sources: list[Path], *, config_path: Path | None = None) -> None:
+    configs = []
+    states = {}
+    for source_dir in sources:
+        location = str(source_dir.resolve())
+        name = json.loads((source_dir / "marketplace.json").read_text(encoding="utf-8"))["name"]
+        source = {"type": "local", "path": location}
+        configs.append({"name": name, "source": source})
+        states[name] = {
+            "name": name,
+            "source": source,
+            "install_location": location,
+            "last_updated": "2025-01-01T00:00:00Z",
+        }
+
+    config_path = config_path or Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(yaml.dump({"marketplaces": configs}, Dumper=YamlDumper, sort_keys=False), encoding="utf-8")
+
+    data_file = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces" / "data.json"
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    data_file.write_text(json.dumps(states, indent=2), encoding="utf-8")
 
 
 def _invoke(args: list[str], env: dict[str, str]) -> Result:
     return RUNNER.invoke(app, args, env=env)
 
 
-def test_add_marketplace_from_git_repo() -> None:
+def _invoke_direct(command: Callable[..., None], env: dict[str, str], *args: object, **kwargs: object) -> str:
+    stdout = io.StringIO()
+    with pytest.MonkeyPatch.context() as monkeypatch, contextlib.redirect_stdout(stdout):
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        command(*args, **kwargs)
+    return stdout.getvalue()
+
+
+@pytest.mark.requires_git
+def test_add_marketplace_from_git_repo(github_mirror: str, env: dict[str, str]) -> None:
     """Journey 1: add marketplace from simulated GitHub source (global scope)."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        mirror_root = base / "git-mirrors"
-        _create_github_mirror("valid-basic", owner="owner", repo="repo", mirror_root=mirror_root)
-        _configure_git_redirect(Path(env["HOME"]), mirror_root)
-
-        result = _invoke(["marketplace", "add", "owner/repo"], env=env)
-        assert result.exit_code == 0, result.stdout + result.stderr
-        assert "✓ Added 'test-marketplace' with 0 bundles (global)" in result.stdout
-
-        config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
-        config = _read_config(config_path)
-        assert config["marketplaces"][0]["name"] == "test-marketplace"
-        assert config["marketplaces"][0]["source"]["type"] == "github"
-        assert config["marketplaces"][0]["source"]["repo"] == "owner/repo"
-
-        data_dir = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces"
-        manifest_path = data_dir / "test-marketplace" / "marketplace.json"
-        assert manifest_path.exists()
-        datastore_content = _read_datastore(data_dir / "data.json")
-        assert "test-marketplace" in datastore_content
-        assert datastore_content["test-marketplace"]["source"]["repo"] == "owner/repo"
-
-
-def test_add_marketplace_to_project_scope() -> None:
-    """Journey 2: add marketplace to project scope and ensure isolation."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
+    _configure_git_redirect(Path(env["HOME"]), github_mirror)
 
-        project_root = base / "project"
-        local_fixture = project_root / "marketplaces" / "internal"
-        _copy_marketplace_fixture("valid-basic", local_fixture)
-        (project_root / ".nova").mkdir(parents=True, exist_ok=True)
+    result = _invoke(["marketplace", "add", "owner/repo"], env=env)
+    assert result.exit_code == 0, result.stdout + result.stderr
+    assert "✓ Added 'test-marketplace' with 0 bundles (global)" in result.stdout
 
-        result = _invoke(
-            ["marketplace", "add", str(local_fixture), "--scope", "project", "--working-dir", str(project_root)],
-            env=env,
-        )
+    config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    config = _read_config(config_path)
+    assert config["marketplaces"][0]["name"] == "test-marketplace"
+    assert config["marketplaces"][0]["source"]["type"] == "github"
+    assert config["marketplaces"][0]["source"]["repo"] == "owner/repo"
 
-        assert result.exit_code == 0, result.stdout + result.stderr
-        assert "✓ Added 'test-marketplace' with 0 bundles (project)" in result.stdout
+    data_dir = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces"
+    manifest_path = data_dir / "test-marketplace" / "marketplace.json"
+    assert manifest_path.exists()
+    datastore_content = _read_datastore(data_dir / "data.json")
+    assert "test-marketplace" in datastore_content
+    assert datastore_content["test-marketplace"]["source"]["repo"] == "owner/repo"
 
-        global_config = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
-        assert not global_config.exists()
 
-        project_config = project_root / ".nova" / "config.yaml"
-        config = _read_config(project_config)
-        assert config["marketplaces"][0]["source"]["type"] == "local"
-        assert config["marketplaces"][0]["source"]["path"] == str(local_fixture.resolve())
+def test_add_marketplace_to_project_scope(env: dict[str, str], tmp_path: Path) -> None:
+    """Journey 2: add marketplace to project scope and ensure isolation."""
+    project_root = tmp_path / "project"
+    local_fixture = project_root / "marketplaces" / "internal"
+    _copy_marketplace_fixture("valid-basic", local_fixture)
+    (project_root / ".nova").mkdir(parents=True, exist_ok=True)
 
-        data_dir = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces"
-        datastore_content = _read_datastore(data_dir / "data.json")
-        assert "test-marketplace" in datastore_content
+    result = _invoke(
+        ["marketplace", "add", str(local_fixture), "--scope", "project", "--working-dir", str(project_root)],
+        env=env,
+    )
 
+    assert result.exit_code == 0, result.stdout + result.stderr
+    assert "✓ Added 'test-marketplace' with 0 bundles (project)" in result.stdout
 
-def test_add_marketplace_duplicate_error() -> None:
-    """Journey 3: adding a duplicate marketplace surfaces helpful error."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        local_dir = base / "local-marketplace"
-        _copy_marketplace_fixture("valid-basic", local_dir)
+    global_config = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    assert not global_config.exists()
 
-        first = _invoke(["marketplace", "add", str(local_dir)], env=env)
-        assert first.exit_code == 0
+    project_config = project_root / ".nova" / "config.yaml"
+    config = _read_config(project_config)
+    assert config["marketplaces"][0]["source"]["type"] == "local"
+    assert config["marketplaces"][0]["source"]["path"] == str(local_fixture.resolve())
 
-        duplicate = _invoke(["marketplace", "add", str(local_dir)], env=env)
-        assert duplicate.exit_code == 1
-        assert "error: marketplace 'test-marketplace' already exists" in duplicate.stderr
-        assert "hint: use 'nova marketplace remove test-marketplace' to replace it" in duplicate.stderr
+    data_dir = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces"
+    datastore_content = _read_datastore(data_dir / "data.json")
+    assert "test-marketplace" in datastore_content
 
-        config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
-        config = _read_config(config_path)
-        assert len(config["marketplaces"]) == 1
 
+def test_add_marketplace_duplicate_error(env: dict[str, str], tmp_path: Path) -> None:
+    """Journey 3: adding a duplicate marketplace surfaces helpful error."""
+    local_dir = tmp_path / "local-marketplace"
+    _copy_marketplace_fixture("valid-basic", local_dir)
 
-def test_add_marketplace_invalid_source() -> None:
-    """Journey 4: invalid source provides guidance."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
+    added = _invoke_direct(marketplace_commands.add, env, str(local_dir))
+    assert "✓ Added 'test-marketplace'" in added
 
-        result = _invoke(["marketplace", "add", "./missing-path"], env=env)
+    duplicate = _invoke(["marketplace", "add", str(local_dir)], env=env)
+    assert duplicate.exit_code == 1
+    assert "error: marketplace 'test-marketplace' already exists" in duplicate.stderr
+    assert "hint: use 'nova marketplace remove test-marketplace' to replace it" in duplicate.stderr
 
-        assert result.exit_code == 1
-        assert "error: invalid marketplace source" in result.stderr
-        assert "valid formats are" in result.stderr
-        assert "owner/repo (GitHub)" in result.stderr
+    config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    config = _read_config(config_path)
+    assert len(config["marketplaces"]) == 1
 
 
-def test_remove_marketplace_by_name() -> None:
-    """Journey 5: remove marketplace by name."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        local_dir = base / "local-marketplace"
-        _copy_marketplace_fixture("valid-basic", local_dir)
+def test_add_marketplace_invalid_source(env: dict[str, str]) -> None:
+    """Journey 4: invalid source provides guidance."""
+    result = _invoke(["marketplace", "add", "./missing-path"], env=env)
+
+    assert result.exit_code == 1
+    assert "error: invalid marketplace source" in result.stderr
+    assert "valid formats are" in result.stderr
+    assert "owner/repo (GitHub)" in result.stderr
 
-        add_result = _invoke(["marketplace", "add", str(local_dir)], env=env)
-        assert add_result.exit_code == 0
 
-        remove_result = _invoke(["marketplace", "remove", "test-marketplace"], env=env)
-        assert remove_result.exit_code == 0
-        assert "✓ Removed 'test-marketplace'" in remove_result.stdout
+def test_remove_marketplace_by_name(seeded_env: dict[str, str]) -> None:
+    """Journey 5: remove marketplace by name."""
+    remove_result = _invoke(["marketplace", "remove", "test-marketplace"], env=seeded_env)
+    assert remove_result.exit_code == 0
+    assert "✓ Removed 'test-marketplace'" in remove_result.stdout
 
-        config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
-        config = _read_config(config_path)
-        assert len(config.get("marketplaces", [])) == 0
+    config_path = Path(seeded_env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    config = _read_config(config_path)
+    assert len(config.get("marketplaces", [])) == 0
 
-        data_dir = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces"
-        datastore_content = _read_datastore(data_dir / "data.json")
-        assert "test-marketplace" not in datastore_content
+    data_dir = Path(seeded_env["XDG_DATA_HOME"]) / "nova" / "marketplaces"
+    datastore_content = _read_datastore(data_dir / "data.json")
+    assert "test-marketplace" not in datastore_content
 
 
-def test_remove_marketplace_by_source() -> None:
+@pytest.mark.requires_git
+def test_remove_marketplace_by_source(github_mirror: str, env: dict[str, str]) -> None:
     """Journey 6: remove marketplace by source."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        mirror_root = base / "git-mirrors"
-        _create_github_mirror("valid-basic", owner="owner", repo="repo", mirror_root=mirror_root)
-        _configure_git_redirect(Path(env["HOME"]), mirror_root)
+    _configure_git_redirect(Path(env["HOME"]), github_mirror)
 
-        add_result = _invoke(["marketplace", "add", "owner/repo"], env=env)
-        assert add_result.exit_code == 0
+    added = _invoke_direct(marketplace_commands.add, env, "owner/repo")
+    assert "✓ Added 'test-marketplace'" in added
 
-        remove_result = _invoke(["marketplace", "remove", "owner/repo"], env=env)
-        assert remove_result.exit_code == 0
-        assert "✓ Removed 'test-marketplace'" in remove_result.stdout
+    remove_result = _invoke(["marketplace", "remove", "owner/repo"], env=env)
+    assert remove_result.exit_code == 0
+    assert "✓ Removed 'test-marketplace'" in remove_result.stdout
 
-        config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
-        config = _read_config(config_path)
-        assert len(config.get("marketplaces", [])) == 0
+    config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    config = _read_config(config_path)
+    assert len(config.get("marketplaces", [])) == 0
 
 
-def test_remove_marketplace_with_scope() -> None:
+def test_remove_marketplace_with_scope(env: dict[str, str], tmp_path: Path) -> None:
     """Journey 7: remove marketplace from specific scope."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        project_root = base / "project"
-        local_fixture = project_root / "marketplaces" / "internal"
-        _copy_marketplace_fixture("valid-basic", local_fixture)
-        (project_root / ".nova").mkdir(parents=True, exist_ok=True)
-
-        add_result = _invoke(
-            ["marketplace", "add", str(local_fixture), "--scope", "project", "--working-dir", str(project_root)],
-            env=env,
-        )
-        assert add_result.exit_code == 0
-
-        remove_result = _invoke(
-            ["marketplace", "remove", "test-marketplace", "--scope", "project", "--working-dir", str(project_root)],
-            env=env,
-        )
-        assert remove_result.exit_code == 0
-        assert "✓ Removed 'test-marketplace'" in remove_result.stdout
-
-        project_config = project_root / ".nova" / "config.yaml"
-        config = _read_config(project_config)
-        assert len(config.get("marketplaces", [])) == 0
-
-
-def test_remove_marketplace_missing_state() -> None:
-    """Journey 8: removal succeeds even if marketplace state is missing."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        local_dir = base / "local-marketplace"
-        _copy_marketplace_fixture("valid-basic", local_dir)
+    project_root = tmp_path / "project"
+    local_fixture = project_root / "marketplaces" / "internal"
+    _copy_marketplace_fixture("valid-basic", local_fixture)
+    (project_root / ".nova").mkdir(parents=True, exist_ok=True)
 
-        add_result = _invoke(["marketplace", "add", str(local_dir)], env=env)
-        assert add_result.exit_code == 0
+    _seed_marketplaces(env, [local_fixture], config_path=project_root / ".nova" / "config.yaml")
 
-        data_file = Path(env["XDG_DATA_HOME"]) / "nova" / "marketplaces" / "data.json"
-        if data_file.exists():
-            data_file.unlink()
+    remove_result = _invoke(
+        ["marketplace", "remove", "test-marketplace", "--scope", "project", "--working-dir", str(project_root)],
+        env=env,
+    )
+    assert remove_result.exit_code == 0
+    assert "✓ Removed 'test-marketplace'" in remove_result.stdout
 
-        remove_result = _invoke(["marketplace", "remove", "test-marketplace"], env=env)
-        assert remove_result.exit_code == 0, remove_result.stderr
-        assert "✓ Removed 'test-marketplace'" in remove_result.stdout
+    project_config = project_root / ".nova" / "config.yaml"
+    config = _read_config(project_config)
+    assert len(config.get("marketplaces", [])) == 0
 
-        config_path = Path(env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
-        config = _read_config(config_path)
-        assert len(config.get("marketplaces", [])) == 0
 
+def test_remove_marketplace_missing_state(seeded_env: dict[str, str]) -> None:
+    """Journey 8: removal succeeds even if marketplace state is missing."""
+    data_file = Path(seeded_env["XDG_DATA_HOME"]) / "nova" / "marketplaces" / "data.json"
+    if data_file.exists():
+        data_file.unlink()
 
-def test_remove_marketplace_not_found() -> None:
-    """Journey 9: removing non-existent marketplace shows helpful error."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
+    remove_result = _invoke(["marketplace", "remove", "test-marketplace"], env=seeded_env)
+    assert remove_result.exit_code == 0, remove_result.stderr
+    assert "✓ Removed 'test-marketplace'" in remove_result.stdout
 
-        result = _invoke(["marketplace", "remove", "non-existent"], env=env)
+    config_path = Path(seeded_env["XDG_CONFIG_HOME"]) / "nova" / "config.yaml"
+    config = _read_config(config_path)
+    assert len(config.get("marketplaces", [])) == 0
 
-        assert result.exit_code == 1
-        assert "Marketplace 'non-existent' not found" in result.stderr
 
+def test_remove_marketplace_not_found(env: dict[str, str]) -> None:
+    """Journey 9: removing non-existent marketplace shows helpful error."""
+    result = _invoke(["marketplace", "remove", "non-existent"], env=env)
 
-def test_list_marketplaces() -> None:
-    """Journey 10: list all configured marketplaces."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        local_dir1 = base / "marketplace1"
-        local_dir2 = base / "marketplace2"
-        _copy_marketplace_fixture("valid-basic", local_dir1)
-        _copy_marketplace_fixture("valid-one-bundle", local_dir2)
+    assert result.exit_code == 1
+    assert "Marketplace 'non-existent' not found" in result.stderr
 
-        add1_result = _invoke(["marketplace", "add", str(local_dir1)], env=env)
-        assert add1_result.exit_code == 0
 
-        add2_result = _invoke(["marketplace", "add", str(local_dir2)], env=env)
-        assert add2_result.exit_code == 0
+def test_list_marketplaces(env: dict[str, str]) -> None:
+    """Journey 10: list all configured marketplaces."""
+    local_dir1 = FIXTURES_DIR / "valid-basic"
+    local_dir2 = FIXTURES_DIR / "valid-one-bundle"
 
-        list_result = _invoke(["marketplace", "list"], env=env)
-        assert list_result.exit_code == 0
-        assert "• test-marketplace" in list_result.stdout
-        assert "• test-one-bundle" in list_result.stdout
-        assert "A test marketplace for manual CLI testing" in list_result.stdout
+    _seed_marketplaces(env, [local_dir1, local_dir2])
 
+    list_result = _invoke(["marketplace", "list"], env=env)
+    assert list_result.exit_code == 0
+    assert "• test-marketplace" in list_result.stdout
+    assert "• test-one-bundle" in list_result.stdout
+    assert "A test marketplace for manual CLI testing" in list_result.stdout
 
-def test_list_no_marketplaces() -> None:
-    """Journey 11: list shows message when no marketplaces configured."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
 
-        result = _invoke(["marketplace", "list"], env=env)
+def test_list_no_marketplaces(env: dict[str, str]) -> None:
+    """Journey 11: list shows message when no marketplaces configured."""
+    result = _invoke(["marketplace", "list"], env=env)
 
-        assert result.exit_code == 0
-        assert "No marketplaces configured" in result.stdout
+    assert result.exit_code == 0
+    assert "No marketplaces configured" in result.stdout
 
 
-def test_show_marketplace() -> None:
+def test_show_marketplace(seeded_env: dict[str, str]) -> None:
     """Journey 12: show details for specific marketplace."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-        local_dir = base / "local-marketplace"
-        _copy_marketplace_fixture("valid-basic", local_dir)
-
-        add_result = _invoke(["marketplace", "add", str(local_dir)], env=env)
-        assert add_result.exit_code == 0
+    show_result = _invoke(["marketplace", "show", "test-marketplace"], env=seeded_env)
+    assert show_result.exit_code == 0
+    assert "test-marketplace" in show_result.stdout
+    assert "Description: A test marketplace for manual CLI testing" in show_result.stdout
+    assert "Source:" in show_result.stdout
+    assert "Bundles:" in show_result.stdout
 
-        show_result = _invoke(["marketplace", "show", "test-marketplace"], env=env)
-        assert show_result.exit_code == 0
-        assert "test-marketplace" in show_result.stdout
-        assert "Description: A test marketplace for manual CLI testing" in show_result.stdout
-        assert "Source:" in show_result.stdout
-        assert "Bundles:" in show_result.stdout
 
-
-def test_show_marketplace_not_found() -> None:
+def test_show_marketplace_not_found(env: dict[str, str]) -> None:
     """Journey 13: show non-existent marketplace shows error."""
-    with RUNNER.isolated_filesystem():
-        base = Path.cwd()
-        env = _create_env(base)
-
-        result = _invoke(["marketplace", "show", "non-existent"], env=env)
+    result = _invoke(["marketplace", "show", "non-existent"], env=env)
 
-        assert result.exit_code == 1
-        assert "error: marketplace 'non-existent' state is corrupted" in result.stderr
+    assert result.exit_code == 1
+    assert "error: marketplace 'non-existent' state is corrupted" in result.stderr
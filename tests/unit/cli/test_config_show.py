@@ -8,6 +8,7 @@ import yaml
 from typer.testing import CliRunner
 
 from nova.cli.main import app
+from nova.utils.yaml import YamlLoader
 
 runner = CliRunner()
 
@@ -49,7 +50,7 @@ feature:
         result = runner.invoke(app, ["config", "show", "--working-dir", str(project_root)], env=env)
 
         assert result.exit_code == 0
-        payload = yaml.safe_load(result.stdout)
+        payload = yaml.load(result.stdout, Loader=YamlLoader)
         assert payload["log"]["level"] == "INFO"
         assert payload["feature"]["retries"] == 2
         assert payload["feature"]["enabled"] is True
@@ -58,6 +58,48 @@ def test_get_project_root_returns_none_when_marker_missing(tmp_path: Path, app_d
     assert root is None
 
 
+def test_get_project_root_falls_back_when_nearer_marker_is_removed(
+    tmp_path: Path, app_directories: AppDirectories
+) -> None:
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    start = inner / "src"
+    start.mkdir(parents=True)
+    (outer / ".nova").mkdir()
+    (inner / ".nova").mkdir()
+
+    assert get_project_root(start_dir=start, directories=app_directories) == inner
+
+    (inner / ".nova").rmdir()
+
+    assert get_project_root(start_dir=start, directories=app_directories) == outer
+
+
+def test_get_project_root_finds_marker_created_after_miss(tmp_path: Path, app_directories: AppDirectories) -> None:
+    start = tmp_path / "workspace"
+    start.mkdir()
+
+    assert get_project_root(start_dir=start, directories=app_directories) is None
+
+    (start / ".nova").mkdir()
+
+    assert get_project_root(start_dir=start, directories=app_directories) == start
+
+
+def test_get_project_root_prefers_nearer_marker_created_later(tmp_path: Path, app_directories: AppDirectories) -> None:
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    start = inner / "src"
+    start.mkdir(parents=True)
+    (outer / ".nova").mkdir()
+
+    assert get_project_root(start_dir=start, directories=app_directories) == outer
+
+    (inner / ".nova").mkdir()
+
+    assert get_project_root(start_dir=start, directories=app_directories) == inner
+
+
 def test_resolve_project_dir_returns_directory_when_present(tmp_path: Path, app_directories: AppDirectories) -> None:
     project_root = tmp_path / "repo"
     project_root.mkdir()
@@ -69,7 +111,9 @@ def test_resolve_project_dir_returns_directory_when_present(tmp_path: Path, app_
     assert resolved == config_dir
 
 
-def test_resolve_project_dir_returns_none_when_directory_missing(tmp_path: Path, app_directories: AppDirectories) -> None:
+def test_resolve_project_dir_returns_none_when_directory_missing(
+    tmp_path: Path, app_directories: AppDirectories
+) -> None:
     project_root = tmp_path / "repo"
     project_root.mkdir()
 
@@ -139,3 +183,22 @@ def test_get_global_config_root_prefers_xdg_config_home(
     config_root = get_global_config_root(directories=app_directories)
 
     assert config_root == xdg_config / app_directories.app_name
+
+
+def test_global_directories_follow_environment_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, app_directories: AppDirectories
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "first"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "first"))
+    first_config = get_global_config_root(directories=app_directories)
+    first_data = get_data_directory_from_dirs(directories=app_directories)
+
+    assert get_global_config_root(directories=app_directories) is first_config
+    assert get_data_directory_from_dirs(directories=app_directories) is first_data
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "second"))
+    monkeypatch.delenv("XDG_DATA_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+    assert get_global_config_root(directories=app_directories) == tmp_path / "second" / "nova"
+    assert get_data_directory_from_dirs(directories=app_directories) == tmp_path / "home" / ".local" / "share" / "nova"
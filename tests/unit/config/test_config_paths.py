@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from nova.common import AppDirectories
+from nova.config.file.paths import discover_config_paths
+from nova.config.file.settings import ConfigFileNames, ConfigStoreSettings
+
+TEST_SETTINGS = ConfigStoreSettings(
+    directories=AppDirectories(
+        app_name="nova",
+        project_marker=".nova",
+    ),
+    filenames=ConfigFileNames(
+        global_file="config.yaml",
+        project_file="config.yaml",
+        user_file="config.local.yaml",
+    ),
+)
+
+
+def test_discover_config_paths_finds_all_scope_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    global_dir = tmp_path / "xdg" / "nova"
+    global_dir.mkdir(parents=True)
+    (global_dir / "config.yaml").write_text("")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+
+    nova_dir = tmp_path / "project" / ".nova"
+    nova_dir.mkdir(parents=True)
+    (nova_dir / "config.yaml").write_text("")
+    (nova_dir / "config.local.yaml").write_text("")
+
+    paths = discover_config_paths(tmp_path / "project", TEST_SETTINGS)
+
+    assert paths.global_path == global_dir / "config.yaml"
+    assert paths.project_path == nova_dir / "config.yaml"
+    assert paths.user_path == nova_dir / "config.local.yaml"
+
+
+def test_discover_config_paths_skips_missing_and_non_file_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+
+    nova_dir = tmp_path / "project" / ".nova"
+    (nova_dir / "config.yaml").mkdir(parents=True)
+    (nova_dir / "config.local.yaml").symlink_to(tmp_path / "missing.yaml")
+
+    paths = discover_config_paths(tmp_path / "project", TEST_SETTINGS)
+
+    assert paths.global_path is None
+    assert paths.project_path is None
+    assert paths.user_path is None
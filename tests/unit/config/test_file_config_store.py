@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -23,6 +24,7 @@ from nova.marketplace.models import (
     MarketplaceConfigError,
 )
 from nova.utils.functools.models import Err, is_err, is_ok
+from nova.utils.yaml import YamlDumper, YamlLoader
 
 TEST_SETTINGS = ConfigStoreSettings(
     directories=AppDirectories(
@@ -37,18 +39,40 @@ TEST_SETTINGS = ConfigStoreSettings(
 )
 
 
+@dataclass(frozen=True)
+class NovaScopes:
+    global_dir: Path
+    project_root: Path
+    project_config_dir: Path
+    working_dir: Path
+
+
+@pytest.fixture
+def nova_scopes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> NovaScopes:
+    project_root = tmp_path / "project"
+    scopes = NovaScopes(
+        global_dir=tmp_path / "xdg" / "nova",
+        project_root=project_root,
+        project_config_dir=project_root / ".nova",
+        working_dir=project_root / "src",
+    )
+    for directory in (scopes.global_dir, scopes.project_config_dir, scopes.working_dir):
+        directory.mkdir(parents=True)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    return scopes
+
+
 def write_yaml(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
 def write_yaml_dict(path: Path, data: object) -> None:
-    path.write_text(yaml.dump(data))
+    path.write_text(yaml.dump(data, Dumper=YamlDumper), encoding="utf-8")
 
 
-def test_file_config_store_loads_and_merges_all_scopes(tmp_path: Path, monkeypatch) -> None:
+def test_file_config_store_loads_and_merges_all_scopes(monkeypatch, nova_scopes: NovaScopes) -> None:
     # Arrange global config
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -59,12 +83,9 @@ feature:
   enabled: false
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     # Arrange project config
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_config_dir = nova_scopes.project_config_dir
     write_yaml(
         project_config_dir / "config.yaml",
         """
@@ -86,8 +107,7 @@ feature:
 """,
     )
 
-    working_dir = project_root / "src"
-    working_dir.mkdir(parents=True)
+    working_dir = nova_scopes.working_dir
 
     # Environment overrides
     monkeypatch.setenv("NOVA_CONFIG__FEATURE__RETRIES", "5")
@@ -106,8 +126,9 @@ feature:
     assert data["list_value"]["items"] == ["x", "y"]
 
 
-def test_get_config_path_for_scope_uses_default_locations(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+def test_get_config_path_for_scope_uses_default_locations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
 
     resolved = ResolvedConfigPaths(global_path=None, project_path=None, user_path=None)
@@ -117,14 +138,13 @@ def test_get_config_path_for_scope_uses_default_locations(tmp_path: Path, monkey
     project_path = store._get_config_path_for_scope(ConfigScope.PROJECT)
     user_path = store._get_config_path_for_scope(ConfigScope.USER)
 
-    assert global_path == tmp_path / "xdg" / TEST_SETTINGS.app_name / TEST_SETTINGS.global_file
+    assert global_path == nova_scopes.global_dir / TEST_SETTINGS.global_file
     assert project_path == tmp_path / TEST_SETTINGS.project_marker / TEST_SETTINGS.project_file
     assert user_path == tmp_path / TEST_SETTINGS.project_marker / TEST_SETTINGS.user_file
 
 
-def test_file_config_store_merges_marketplaces_from_multiple_scopes(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_file_config_store_merges_marketplaces_from_multiple_scopes(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -135,11 +155,9 @@ marketplaces:
       repo: owner/official
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     local_marketplace_dir = project_root / "marketplaces" / "internal"
     local_marketplace_dir.mkdir(parents=True)
     override_marketplace_dir = project_root / "marketplaces" / "internal-override"
@@ -173,8 +191,7 @@ marketplaces:
 """,
     )
 
-    working_dir = project_root / "src"
-    working_dir.mkdir(parents=True)
+    working_dir = nova_scopes.working_dir
 
     store = FileConfigStore(working_dir=working_dir, settings=TEST_SETTINGS)
     result = store.load()
@@ -188,8 +205,9 @@ marketplaces:
     assert config.marketplaces[2].source.repo == "owner/user-only"
 
 
-def test_file_config_store_returns_defaults_when_no_files_exist(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+def test_file_config_store_returns_defaults_when_no_files_exist(
+    tmp_path: Path, monkeypatch, nova_scopes: NovaScopes
+) -> None:
     monkeypatch.setattr(Path, "cwd", lambda: tmp_path, raising=False)
 
     store = FileConfigStore(working_dir=Path.cwd(), settings=TEST_SETTINGS)
@@ -202,13 +220,11 @@ def test_file_config_store_returns_defaults_when_no_files_exist(tmp_path: Path,
     assert config.logging.log_level == "INFO"
 
 
-def test_file_config_store_returns_error_on_invalid_yaml(tmp_path: Path, monkeypatch) -> None:
+def test_file_config_store_returns_error_on_invalid_yaml(tmp_path: Path, nova_scopes: NovaScopes) -> None:
     """Test that invalid YAML in global config returns ConfigYamlError."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     global_config.write_text("foo: [")  # Invalid YAML
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load()
@@ -220,17 +236,33 @@ def test_file_config_store_returns_error_on_invalid_yaml(tmp_path: Path, monkeyp
     assert error.message
 
 
-def test_file_config_store_returns_user_scope_error_when_user_yaml_invalid(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_file_config_store_returns_yaml_error_on_invalid_utf8(nova_scopes: NovaScopes) -> None:
+    global_config = nova_scopes.global_dir / "config.yaml"
+    global_config.write_bytes(b"feature: \xff\n")
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+    result = store.load()
+
+    assert is_err(result)
+    error = result.err_value
+    assert isinstance(error, ConfigYamlError)
+    assert error.path == global_config
+
+
+def test_file_config_store_reads_utf16_config_with_bom(nova_scopes: NovaScopes) -> None:
+    (nova_scopes.global_dir / "config.yaml").write_bytes("owner: José\n".encode("utf-16"))
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+
+    assert store.load().unwrap().model_dump()["owner"] == "José"
+
+
+def test_file_config_store_returns_user_scope_error_when_user_yaml_invalid(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml_dict(global_dir / "config.yaml", {"from_global": True})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     write_yaml_dict(project_config_dir / "config.yaml", {"from_project": True})
     user_config = project_config_dir / "config.local.yaml"
     user_config.write_text("invalid: [")
@@ -245,16 +277,13 @@ def test_file_config_store_returns_user_scope_error_when_user_yaml_invalid(
     assert error.path == user_config
 
 
-def test_file_config_store_returns_error_on_non_mapping_root(tmp_path: Path, monkeypatch) -> None:
+def test_file_config_store_returns_error_on_non_mapping_root(nova_scopes: NovaScopes) -> None:
     """Test that non-mapping root in project config returns ConfigValidationError."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml_dict(global_dir / "config.yaml", {})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     project_config = project_config_dir / "config.yaml"
     write_yaml_dict(project_config, ["not", "a", "mapping"])  # List instead of dict
 
@@ -268,17 +297,12 @@ def test_file_config_store_returns_error_on_non_mapping_root(tmp_path: Path, mon
     assert error.message == "Configuration root must be a mapping of keys to values."
 
 
-def test_file_config_store_returns_validation_error_when_marketplace_invalid(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_file_config_store_returns_validation_error_when_marketplace_invalid(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml_dict(global_dir / "config.yaml", {})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     project_config = project_config_dir / "config.yaml"
     write_yaml(
         project_config,
@@ -303,18 +327,13 @@ marketplaces:
     assert "Field required" in error.message or "Input should contain" in error.message
 
 
-def test_file_config_store_returns_error_on_falsy_non_mapping_root(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
+def test_file_config_store_returns_error_on_falsy_non_mapping_root(nova_scopes: NovaScopes) -> None:
     """Test that falsy non-mapping YAML roots (e.g. 'false') are rejected."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml_dict(global_dir / "config.yaml", {})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     project_config = project_config_dir / "config.yaml"
     write_yaml(project_config, "false\n")
 
@@ -328,16 +347,15 @@ def test_file_config_store_returns_error_on_falsy_non_mapping_root(
     assert error.message == "Configuration root must be a mapping of keys to values."
 
 
-def test_file_config_store_short_circuits_after_scope_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_file_config_store_short_circuits_after_scope_error(
+    monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
     """Ensure later scopes are not processed once an error occurs."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml_dict(global_dir / "config.yaml", {"global": True})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     project_config = project_config_dir / "config.yaml"
     write_yaml_dict(project_config, ["invalid", "root"])
     user_config = project_config_dir / "config.local.yaml"
@@ -350,19 +368,14 @@ user_scope: true
 
     store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
 
-    original = FileConfigStore._load_scope_config
+    original = FileConfigStore._read_scope_data
     called_scopes: list[ConfigScope] = []
 
-    def tracking(
-        self: FileConfigStore,
-        path: Path,
-        model_cls: type[object],
-        scope: ConfigScope,
-    ):
+    def tracking(self: FileConfigStore, path: Path, scope: ConfigScope):
         called_scopes.append(scope)
-        return original(self, path, model_cls, scope)
+        return original(self, path, scope)
 
-    monkeypatch.setattr(FileConfigStore, "_load_scope_config", tracking, raising=False)
+    monkeypatch.setattr(FileConfigStore, "_read_scope_data", tracking, raising=False)
 
     result = store.load()
 
@@ -390,22 +403,22 @@ def test_load_scope_returns_config_not_found_when_expected_file_missing(
     assert error.expected_path == missing_path
 
 
-def test_file_config_store_returns_error_on_io_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_file_config_store_returns_error_on_io_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
     """Test that IO errors when reading config return ConfigIOError."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml_dict(global_config, {})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    original_read_text = Path.read_text
+    original_read_bytes = Path.read_bytes
 
-    def fake_read_text(self: Path, *args, **kwargs):
+    def fake_read_bytes(self: Path) -> bytes:
         if self == global_config:
             raise OSError("Permission denied")
-        return original_read_text(self, *args, **kwargs)
+        return original_read_bytes(self)
 
-    monkeypatch.setattr(Path, "read_text", fake_read_text, raising=False)
+    monkeypatch.setattr(Path, "read_bytes", fake_read_bytes)
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load()
@@ -417,10 +430,29 @@ def test_file_config_store_returns_error_on_io_failure(tmp_path: Path, monkeypat
     assert error.message == "Permission denied"
 
 
-def test_file_config_store_finds_configs_in_nested_directories(tmp_path: Path, monkeypatch) -> None:
+def test_load_scope_returns_config_not_found_when_file_disappears_before_read(
+    monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
+    global_config = nova_scopes.global_dir / "config.yaml"
+    write_yaml_dict(global_config, {})
+
+    def vanished(self: Path) -> bytes:
+        raise FileNotFoundError(self)
+
+    monkeypatch.setattr(Path, "read_bytes", vanished)
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+    result = store.load_scope(ConfigScope.GLOBAL)
+
+    assert is_err(result)
+    error = result.err_value
+    assert isinstance(error, ConfigNotFoundError)
+    assert error.expected_path == global_config
+
+
+def test_file_config_store_finds_configs_in_nested_directories(nova_scopes: NovaScopes) -> None:
     """Test that FileConfigStore finds configs when working_dir is nested deep in project."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -428,11 +460,8 @@ log:
   level: DEBUG
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_config_dir = nova_scopes.project_config_dir
     write_yaml(
         project_config_dir / "config.yaml",
         """
@@ -442,7 +471,7 @@ feature:
     )
 
     # Working directory is nested 3 levels deep
-    nested_dir = project_root / "src" / "nova" / "cli"
+    nested_dir = nova_scopes.working_dir / "nova" / "cli"
     nested_dir.mkdir(parents=True)
 
     store = FileConfigStore(working_dir=nested_dir, settings=TEST_SETTINGS)
@@ -456,22 +485,18 @@ feature:
 
 
 def test_file_config_store_defaults_to_cwd_when_no_working_dir_provided(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
 ) -> None:
     """Test that FileConfigStore defaults to cwd when working_dir is None."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
 from_global: true
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_config_dir = nova_scopes.project_config_dir
     write_yaml(
         project_config_dir / "config.yaml",
         """
@@ -479,7 +504,7 @@ from_project: true
 """,
     )
 
-    working_dir = project_root / "src" / "deep"
+    working_dir = nova_scopes.working_dir / "deep"
     working_dir.mkdir(parents=True)
     monkeypatch.setattr(Path, "cwd", lambda: working_dir, raising=False)
 
@@ -494,20 +519,16 @@ from_project: true
     assert data["from_project"] is True
 
 
-def test_file_config_store_handles_missing_project_config_gracefully(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
+def test_file_config_store_handles_missing_project_config_gracefully(tmp_path: Path, nova_scopes: NovaScopes) -> None:
     """Test that FileConfigStore handles missing project/user config files gracefully (not an error)."""
     # Only global config exists
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
 only_global: true
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     # Working directory has no .nova folder
     working_dir = tmp_path / "no_project"
@@ -524,10 +545,9 @@ only_global: true
     assert data["marketplaces"] == []
 
 
-def test_get_marketplace_config_returns_merged_marketplaces(tmp_path: Path, monkeypatch) -> None:
+def test_get_marketplace_config_returns_merged_marketplaces(nova_scopes: NovaScopes) -> None:
     """Test that get_marketplace_config returns merged marketplace list from all scopes."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -538,11 +558,9 @@ marketplaces:
       repo: owner/official
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     local_marketplace_dir = project_root / "marketplaces" / "internal"
     local_marketplace_dir.mkdir(parents=True)
     write_yaml(
@@ -568,12 +586,12 @@ marketplaces:
     assert str(marketplaces[1].source.path) == str(local_marketplace_dir)
 
 
-def test_get_marketplace_config_returns_empty_list_when_no_marketplaces(tmp_path: Path, monkeypatch) -> None:
+def test_get_marketplace_config_returns_empty_list_when_no_marketplaces(
+    tmp_path: Path, nova_scopes: NovaScopes
+) -> None:
     """Test that get_marketplace_config returns empty list when no marketplaces configured."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.get_marketplace_configs()
@@ -583,13 +601,11 @@ def test_get_marketplace_config_returns_empty_list_when_no_marketplaces(tmp_path
     assert marketplaces == []
 
 
-def test_get_marketplace_config_propagates_config_errors(tmp_path: Path, monkeypatch) -> None:
+def test_get_marketplace_config_propagates_config_errors(tmp_path: Path, nova_scopes: NovaScopes) -> None:
     """Test that get_marketplace_config propagates errors from load()."""
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml(global_config, "invalid: [")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.get_marketplace_configs()
@@ -600,9 +616,8 @@ def test_get_marketplace_config_propagates_config_errors(tmp_path: Path, monkeyp
     assert error.scope == "global"
 
 
-def test_has_marketplace_returns_true_when_name_matches(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_has_marketplace_returns_true_when_name_matches(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -613,7 +628,6 @@ marketplaces:
       repo: owner/official
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.has_marketplace(
@@ -625,9 +639,8 @@ marketplaces:
     assert result.unwrap() is True
 
 
-def test_has_marketplace_returns_true_when_source_matches(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_has_marketplace_returns_true_when_source_matches(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -638,7 +651,6 @@ marketplaces:
       repo: owner/official
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.has_marketplace(
@@ -650,9 +662,8 @@ marketplaces:
     assert result.unwrap() is True
 
 
-def test_has_marketplace_returns_false_when_no_match(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_has_marketplace_returns_false_when_no_match(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -663,7 +674,6 @@ marketplaces:
       repo: owner/official
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.has_marketplace(
@@ -675,11 +685,9 @@ marketplaces:
     assert result.unwrap() is False
 
 
-def test_has_marketplace_returns_false_when_no_marketplaces_configured(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_has_marketplace_returns_false_when_no_marketplaces_configured(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.has_marketplace(
@@ -691,12 +699,10 @@ def test_has_marketplace_returns_false_when_no_marketplaces_configured(tmp_path:
     assert result.unwrap() is False
 
 
-def test_has_marketplace_propagates_config_errors(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_has_marketplace_propagates_config_errors(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml(global_config, "invalid: [")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.has_marketplace(
@@ -709,9 +715,8 @@ def test_has_marketplace_propagates_config_errors(tmp_path: Path, monkeypatch) -
     assert isinstance(error, MarketplaceConfigError)
 
 
-def test_load_scope_returns_global_config(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_returns_global_config(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -722,7 +727,6 @@ marketplaces:
       repo: owner/global
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load_scope(ConfigScope.GLOBAL)
@@ -734,15 +738,12 @@ marketplaces:
     assert config.marketplaces[0].name == "global-marketplace"
 
 
-def test_load_scope_returns_project_config(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_returns_project_config(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     write_yaml(
         project_config_dir / "config.yaml",
         """
@@ -764,15 +765,12 @@ marketplaces:
     assert config.marketplaces[0].name == "project-marketplace"
 
 
-def test_load_scope_returns_user_config(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_returns_user_config(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir(parents=True)
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
     write_yaml(project_config_dir / "config.yaml", "")
     write_yaml(
         project_config_dir / "config.local.yaml",
@@ -795,11 +793,9 @@ marketplaces:
     assert config.marketplaces[0].name == "user-marketplace"
 
 
-def test_load_scope_returns_none_when_scope_not_found(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_returns_none_when_scope_not_found(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load_scope(ConfigScope.PROJECT)
@@ -809,12 +805,10 @@ def test_load_scope_returns_none_when_scope_not_found(tmp_path: Path, monkeypatc
     assert config is None
 
 
-def test_load_scope_propagates_validation_errors(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_propagates_validation_errors(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml(global_config, "invalid: [")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load_scope(ConfigScope.GLOBAL)
@@ -824,21 +818,19 @@ def test_load_scope_propagates_validation_errors(tmp_path: Path, monkeypatch) ->
     assert isinstance(error, ConfigYamlError)
 
 
-def test_load_scope_returns_error_on_io_failure(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_returns_error_on_io_failure(tmp_path: Path, monkeypatch, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml_dict(global_config, {})
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    original_read_text = Path.read_text
+    original_read_bytes = Path.read_bytes
 
-    def fake_read_text(self: Path, *args, **kwargs):
+    def fake_read_bytes(self: Path) -> bytes:
         if self == global_config:
             raise OSError("Permission denied")
-        return original_read_text(self, *args, **kwargs)
+        return original_read_bytes(self)
 
-    monkeypatch.setattr(Path, "read_text", fake_read_text, raising=False)
+    monkeypatch.setattr(Path, "read_bytes", fake_read_bytes)
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load_scope(ConfigScope.GLOBAL)
@@ -850,12 +842,10 @@ def test_load_scope_returns_error_on_io_failure(tmp_path: Path, monkeypatch) ->
     assert error.message == "Permission denied"
 
 
-def test_load_scope_returns_error_on_non_mapping_root(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_load_scope_returns_error_on_non_mapping_root(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml_dict(global_config, ["not", "a", "mapping"])
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     result = store.load_scope(ConfigScope.GLOBAL)
@@ -867,10 +857,8 @@ def test_load_scope_returns_error_on_non_mapping_root(tmp_path: Path, monkeypatc
     assert error.message == "Configuration root must be a mapping of keys to values."
 
 
-def test_add_marketplace_creates_new_global_config(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+def test_add_marketplace_creates_new_global_config(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     marketplace = MarketplaceConfig(
@@ -883,21 +871,18 @@ def test_add_marketplace_creates_new_global_config(tmp_path: Path, monkeypatch)
     assert is_ok(result)
     global_config = global_dir / "config.yaml"
     assert global_config.exists()
-    data = yaml.safe_load(global_config.read_text())
+    data = yaml.load(global_config.read_text(), Loader=YamlLoader)
     assert "marketplaces" in data
     assert len(data["marketplaces"]) == 1
     assert data["marketplaces"][0]["name"] == "test-marketplace"
     assert data["marketplaces"][0]["source"]["repo"] == "owner/repo"
 
 
-def test_add_marketplace_creates_new_project_config(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_add_marketplace_creates_new_project_config(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
-    project_root = tmp_path / "project"
-    project_root.mkdir()
+    project_root = nova_scopes.project_root
 
     store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
     marketplace = MarketplaceConfig(
@@ -910,14 +895,48 @@ def test_add_marketplace_creates_new_project_config(tmp_path: Path, monkeypatch)
     assert is_ok(result)
     project_config = project_root / ".nova" / "config.yaml"
     assert project_config.exists()
-    data = yaml.safe_load(project_config.read_text())
+    data = yaml.load(project_config.read_text(), Loader=YamlLoader)
     assert len(data["marketplaces"]) == 1
     assert data["marketplaces"][0]["name"] == "project-marketplace"
 
 
-def test_add_marketplace_appends_to_existing_marketplaces(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_file_config_store_discovers_paths_once_per_instance(
+    tmp_path: Path, monkeypatch, nova_scopes: NovaScopes
+) -> None:
+    calls: list[Path] = []
+    original = store_module.discover_config_paths
+
+    def counting_discover(working_dir: Path, settings: ConfigStoreSettings) -> ResolvedConfigPaths:
+        calls.append(working_dir)
+        return original(working_dir, settings)
+
+    monkeypatch.setattr(store_module, "discover_config_paths", counting_discover)
+
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+
+    assert is_ok(store.load())
+    assert is_ok(store.get_marketplace_configs())
+    assert is_ok(store.load_scope(ConfigScope.GLOBAL))
+    assert calls == [tmp_path]
+
+
+def test_add_marketplace_new_file_is_visible_to_same_store(nova_scopes: NovaScopes) -> None:
+    project_root = nova_scopes.project_root
+
+    store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
+    assert store.get_marketplace_configs().unwrap() == []
+
+    marketplace = MarketplaceConfig(
+        name="project-marketplace",
+        source=GitHubMarketplaceSource(type="github", repo="owner/project"),
+    )
+    assert is_ok(store.add_marketplace(marketplace, MarketplaceScope.PROJECT))
+
+    assert [m.name for m in store.get_marketplace_configs().unwrap()] == ["project-marketplace"]
+
+
+def test_add_marketplace_appends_to_existing_marketplaces(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(
         global_dir / "config.yaml",
         """
@@ -928,7 +947,6 @@ marketplaces:
       repo: owner/existing
 """,
     )
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     marketplace = MarketplaceConfig(
@@ -939,18 +957,48 @@ marketplaces:
     result = store.add_marketplace(marketplace, MarketplaceScope.GLOBAL)
 
     assert is_ok(result)
-    data = yaml.safe_load((global_dir / "config.yaml").read_text())
+    data = yaml.load((global_dir / "config.yaml").read_text(), Loader=YamlLoader)
     assert len(data["marketplaces"]) == 2
     assert data["marketplaces"][0]["name"] == "existing"
     assert data["marketplaces"][1]["name"] == "new-marketplace"
 
 
-def test_add_marketplace_propagates_load_errors(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_add_marketplace_keeps_other_sections(nova_scopes: NovaScopes) -> None:
+    global_config = nova_scopes.global_dir / "config.yaml"
+    write_yaml(
+        global_config,
+        """
+logging:
+  log_level: DEBUG
+marketplaces:
+  - name: existing
+    source:
+      type: github
+      repo: owner/existing
+feature:
+  enabled: true
+""",
+    )
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+    marketplace = MarketplaceConfig(
+        name="new",
+        source=GitHubMarketplaceSource(type="github", repo="owner/new"),
+    )
+
+    result = store.add_marketplace(marketplace, MarketplaceScope.GLOBAL)
+
+    assert is_ok(result)
+    data = yaml.load(global_config.read_text(), Loader=YamlLoader)
+    assert data["logging"] == {"log_level": "DEBUG"}
+    assert data["feature"] == {"enabled": True}
+    assert [m["name"] for m in data["marketplaces"]] == ["existing", "new"]
+
+
+def test_add_marketplace_propagates_load_errors(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     global_config = global_dir / "config.yaml"
     write_yaml(global_config, "invalid: [")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     marketplace = MarketplaceConfig(
@@ -965,11 +1013,32 @@ def test_add_marketplace_propagates_load_errors(tmp_path: Path, monkeypatch) ->
     assert isinstance(error, MarketplaceConfigError)
 
 
-def test_add_marketplace_propagates_write_errors(tmp_path: Path, monkeypatch) -> None:
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_add_marketplace_rejects_invalid_scope_without_writing(nova_scopes: NovaScopes) -> None:
+    project_config = nova_scopes.project_config_dir / "config.yaml"
+    write_yaml(
+        project_config,
+        """
+logging:
+  log_level: DEBUG
+""",
+    )
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+    marketplace = MarketplaceConfig(
+        name="new",
+        source=GitHubMarketplaceSource(type="github", repo="owner/new"),
+    )
+
+    result = store.add_marketplace(marketplace, MarketplaceScope.PROJECT)
+
+    assert is_err(result)
+    assert isinstance(result.err_value, MarketplaceConfigError)
+    assert yaml.load(project_config.read_text(), Loader=YamlLoader) == {"logging": {"log_level": "DEBUG"}}
+
+
+def test_add_marketplace_propagates_write_errors(tmp_path: Path, monkeypatch, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml(global_dir / "config.yaml", "")
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
     marketplace = MarketplaceConfig(
@@ -993,10 +1062,8 @@ def test_add_marketplace_propagates_write_errors(tmp_path: Path, monkeypatch) ->
     assert isinstance(error, MarketplaceConfigError)
 
 
-def test_remove_marketplace_removes_entry_from_global_scope(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_remove_marketplace_removes_entry_from_global_scope(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
 
     marketplace = MarketplaceConfig(
         name="global-marketplace",
@@ -1011,17 +1078,14 @@ def test_remove_marketplace_removes_entry_from_global_scope(tmp_path: Path, monk
     assert is_ok(result)
     removed = result.unwrap()
     assert removed.name == "global-marketplace"
-    config_data = yaml.safe_load((global_dir / "config.yaml").read_text()) or {}
+    config_data = yaml.load((global_dir / "config.yaml").read_text(), Loader=YamlLoader) or {}
     assert config_data.get("marketplaces") == []
 
 
-def test_remove_marketplace_with_scope_none_checks_all_scopes(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+def test_remove_marketplace_with_scope_none_checks_all_scopes(nova_scopes: NovaScopes) -> None:
 
-    project_root = tmp_path / "project"
-    project_root.mkdir()
-    project_config_dir = project_root / ".nova"
-    project_config_dir.mkdir()
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
 
     marketplace = MarketplaceConfig(
         name="project-marketplace",
@@ -1036,14 +1100,12 @@ def test_remove_marketplace_with_scope_none_checks_all_scopes(tmp_path: Path, mo
     assert is_ok(result)
     removed = result.unwrap()
     assert removed.name == "project-marketplace"
-    config_data = yaml.safe_load((project_config_dir / "config.yaml").read_text()) or {}
+    config_data = yaml.load((project_config_dir / "config.yaml").read_text(), Loader=YamlLoader) or {}
     assert config_data.get("marketplaces") == []
 
 
-def test_remove_marketplace_returns_not_found_when_missing(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_remove_marketplace_returns_not_found_when_missing(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
     write_yaml_dict(global_dir / "config.yaml", {"marketplaces": []})
 
     store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
@@ -1056,20 +1118,10 @@ def test_remove_marketplace_returns_not_found_when_missing(tmp_path: Path, monke
     assert "missing" in error.message
 
 
-def test_remove_marketplace_propagates_load_errors(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
-    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+def test_remove_marketplace_propagates_load_errors(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    write_yaml(nova_scopes.global_dir / "config.yaml", "invalid: [")
 
-    def fake_load_scope(self: FileConfigStore, scope: ConfigScope):
-        return Err(
-            ConfigIOError(
-                scope=scope,
-                path=tmp_path / "missing",
-                message="boom",
-            )
-        )
-
-    monkeypatch.setattr(FileConfigStore, "load_scope", fake_load_scope, raising=False)
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
 
     result = store.remove_marketplace("test", MarketplaceScope.GLOBAL)
 
@@ -1077,12 +1129,43 @@ def test_remove_marketplace_propagates_load_errors(tmp_path: Path, monkeypatch)
     error = result.err_value
     assert isinstance(error, MarketplaceConfigError)
     assert error.scope == MarketplaceScope.GLOBAL.value
+    assert error.message.startswith("Failed to load existing config")
 
 
-def test_remove_marketplace_propagates_write_errors(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
-    global_dir = tmp_path / "xdg" / "nova"
-    global_dir.mkdir(parents=True)
+def test_remove_marketplace_keeps_other_sections(nova_scopes: NovaScopes) -> None:
+    global_config = nova_scopes.global_dir / "config.yaml"
+    write_yaml(
+        global_config,
+        """
+logging:
+  log_level: DEBUG
+marketplaces:
+  - name: first
+    source:
+      type: github
+      repo: owner/first
+  - name: second
+    source:
+      type: github
+      repo: owner/second
+feature:
+  enabled: true
+""",
+    )
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+
+    result = store.remove_marketplace("first", MarketplaceScope.GLOBAL)
+
+    assert is_ok(result)
+    data = yaml.load(global_config.read_text(), Loader=YamlLoader)
+    assert data["logging"] == {"log_level": "DEBUG"}
+    assert data["feature"] == {"enabled": True}
+    assert [m["name"] for m in data["marketplaces"]] == ["second"]
+
+
+def test_remove_marketplace_propagates_write_errors(tmp_path: Path, monkeypatch, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
 
     marketplace = MarketplaceConfig(
         name="global-marketplace",
@@ -1109,3 +1192,248 @@ def test_remove_marketplace_propagates_write_errors(tmp_path: Path, monkeypatch)
     error = result.err_value
     assert isinstance(error, MarketplaceConfigError)
     assert error.scope == MarketplaceScope.GLOBAL.value
+
+
+def test_load_reuses_parsed_yaml_while_file_is_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
+    global_dir = nova_scopes.global_dir
+    global_config = global_dir / "config.yaml"
+    write_yaml(global_config, "feature:\n  retries: 1\n")
+
+    parse_calls: list[bytes] = []
+    original_load = yaml.load
+
+    def counting_load(stream, **kwargs):
+        parse_calls.append(stream)
+        return original_load(stream, **kwargs)
+
+    monkeypatch.setattr(store_module.yaml, "load", counting_load)
+
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+    assert store.load().unwrap().model_dump()["feature"]["retries"] == 1
+    assert store.load().unwrap().model_dump()["feature"]["retries"] == 1
+    assert len(parse_calls) == 1
+
+    write_yaml(global_config, "feature:\n  retries: 22\n")
+
+    assert store.load().unwrap().model_dump()["feature"]["retries"] == 22
+    assert len(parse_calls) == 2
+
+
+def test_load_returns_fresh_data_after_loaded_config_is_mutated(nova_scopes: NovaScopes) -> None:
+    write_yaml(nova_scopes.global_dir / "config.yaml", "feature:\n  tags: [a]\n")
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+
+    first = store.load().unwrap()
+    assert first.model_extra is not None
+    first.model_extra["feature"]["tags"].append("b")
+
+    assert store.load().unwrap().model_dump()["feature"]["tags"] == ["a"]
+
+
+def test_parsed_yaml_cache_evicts_least_recently_used_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(store_module, "_PARSED_YAML_CACHE_SIZE", 2)
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+    paths = [tmp_path / f"config-{index}.yaml" for index in range(3)]
+    for path in paths:
+        write_yaml_dict(path, {})
+
+    for path in (paths[0], paths[1], paths[0], paths[2]):
+        assert is_ok(store._read_scope_data(path, ConfigScope.GLOBAL))
+
+    assert list(store._parsed_yaml_cache) == [str(paths[0]), str(paths[2])]
+
+
+def test_add_marketplace_invalidates_parsed_yaml(tmp_path: Path, nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
+    write_yaml(global_dir / "config.yaml", "")
+
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+    assert store.get_marketplace_configs().unwrap() == []
+
+    marketplace = MarketplaceConfig(
+        name="test",
+        source=GitHubMarketplaceSource(type="github", repo="owner/repo"),
+    )
+    assert is_ok(store.add_marketplace(marketplace, MarketplaceScope.GLOBAL))
+
+    assert store.get_marketplace_configs().unwrap() == [marketplace]
+
+
+def test_get_marketplace_configs_rejects_files_that_load_rejects(nova_scopes: NovaScopes) -> None:
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
+    write_yaml(
+        project_config_dir / "config.yaml",
+        """
+logging:
+  log_level: LOUD
+marketplaces:
+  - name: project-only
+    source:
+      type: github
+      repo: owner/project
+""",
+    )
+
+    store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
+
+    assert is_err(store.load())
+    result = store.get_marketplace_configs()
+
+    assert is_err(result)
+    assert result.err_value.scope == ConfigScope.PROJECT.value
+
+
+def test_get_marketplace_configs_lets_user_scope_replace_by_name(nova_scopes: NovaScopes) -> None:
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
+    write_yaml(
+        project_config_dir / "config.yaml",
+        """
+marketplaces:
+  - name: shared
+    source:
+      type: github
+      repo: owner/project
+""",
+    )
+    write_yaml(
+        project_config_dir / "config.local.yaml",
+        """
+marketplaces:
+  - name: shared
+    source:
+      type: github
+      repo: owner/local
+""",
+    )
+
+    store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
+    result = store.get_marketplace_configs()
+
+    assert is_ok(result)
+    assert result.unwrap() == store.load().unwrap().marketplaces
+    assert [m.source.repo for m in result.unwrap()] == ["owner/local"]
+
+
+@pytest.mark.parametrize(
+    "env_key",
+    ["NOVA_CONFIG__MARKETPLACES", "NOVA_CONFIG__marketplaces", "NOVA_CONFIG___MARKETPLACES"],
+)
+def test_get_marketplace_configs_applies_marketplace_env_override(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes, env_key: str
+) -> None:
+    global_dir = nova_scopes.global_dir
+    write_yaml(
+        global_dir / "config.yaml",
+        """
+marketplaces:
+  - name: official
+    source:
+      type: github
+      repo: owner/official
+""",
+    )
+    monkeypatch.setenv(env_key, "[]")
+
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+    result = store.get_marketplace_configs()
+
+    assert is_ok(result)
+    assert result.unwrap() == []
+
+
+def test_file_config_store_sees_env_override_changes_between_loads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
+    monkeypatch.setenv("NOVA_CONFIG__FEATURE__RETRIES", "1")
+
+    store = FileConfigStore(working_dir=tmp_path, settings=TEST_SETTINGS)
+
+    assert store.load().unwrap().model_dump()["feature"] == {"retries": 1}
+
+    monkeypatch.setenv("NOVA_CONFIG__FEATURE__RETRIES", "2")
+
+    assert store.load().unwrap().model_dump()["feature"] == {"retries": 2}
+
+
+def test_has_marketplace_reports_invalid_scope_even_when_another_scope_matches(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
+    write_yaml(global_dir / "config.yaml", "invalid: [")
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
+    write_yaml(
+        project_config_dir / "config.yaml",
+        """
+marketplaces:
+  - name: project-marketplace
+    source:
+      type: github
+      repo: owner/project
+""",
+    )
+
+    store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
+    result = store.has_marketplace(
+        "project-marketplace",
+        GitHubMarketplaceSource(type="github", repo="owner/other"),
+    )
+
+    assert is_err(result)
+    assert result.err_value.scope == ConfigScope.GLOBAL.value
+
+
+def test_has_marketplace_ignores_sources_shadowed_by_higher_scope(nova_scopes: NovaScopes) -> None:
+    global_dir = nova_scopes.global_dir
+    write_yaml(
+        global_dir / "config.yaml",
+        """
+marketplaces:
+  - name: shared
+    source:
+      type: github
+      repo: owner/global
+""",
+    )
+    project_root = nova_scopes.project_root
+    project_config_dir = nova_scopes.project_config_dir
+    write_yaml(
+        project_config_dir / "config.yaml",
+        """
+marketplaces:
+  - name: shared
+    source:
+      type: github
+      repo: owner/project
+""",
+    )
+
+    store = FileConfigStore(working_dir=project_root, settings=TEST_SETTINGS)
+    result = store.has_marketplace("other", GitHubMarketplaceSource(type="github", repo="owner/global"))
+
+    assert is_ok(result)
+    assert result.unwrap() is False
+
+
+def test_has_marketplace_honours_lowercase_marketplace_env_override(
+    monkeypatch: pytest.MonkeyPatch, nova_scopes: NovaScopes
+) -> None:
+    write_yaml(
+        nova_scopes.global_dir / "config.yaml",
+        """
+marketplaces:
+  - name: official
+    source:
+      type: github
+      repo: owner/official
+""",
+    )
+    monkeypatch.setenv("NOVA_CONFIG__marketplaces", "[]")
+
+    store = FileConfigStore(working_dir=nova_scopes.working_dir, settings=TEST_SETTINGS)
+    result = store.has_marketplace("official", GitHubMarketplaceSource(type="github", repo="owner/official"))
+
+    assert is_ok(result)
+    assert result.unwrap() is False
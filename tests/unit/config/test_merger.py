@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from nova.config.merger import merge_configs
+from nova.config.merger import merge_config_data, merge_configs
 from nova.config.models import GlobalConfig, NovaConfig, ProjectConfig, UserConfig
 
 
@@ -90,3 +90,15 @@ def test_merge_marketplaces_combines_scopes(tmp_path: Path) -> None:
     assert names == ["official", "internal"]
     assert result.marketplaces[0].source.type == "github"
     assert result.marketplaces[1].source.type == "local"
+
+
+def test_merge_config_data_applies_overrides_after_scopes() -> None:
+    global_data = {"feature": {"enabled": False, "retries": 1}, "items": ["g"]}
+    user_data = {"feature": {"enabled": True, "note": None}}
+
+    result = merge_config_data(global_data, None, user_data, overrides={"feature": {"retries": 5}, "items": ["o"]})
+
+    data = result.model_dump()
+    assert data["feature"] == {"enabled": True, "retries": 5}
+    assert data["items"] == ["o"]
+    assert global_data == {"feature": {"enabled": False, "retries": 1}, "items": ["g"]}
@@ -69,3 +69,17 @@ def test_apply_env_overrides_returns_raw_string_on_yaml_error(monkeypatch: pytes
 
     data = resolved.model_dump()
     assert data["feature"]["metadata"]["source"] == "invalid: ["
+
+
+def test_apply_env_overrides_parses_json_and_yaml_flow_collections(monkeypatch: pytest.MonkeyPatch) -> None:
+    base = NovaConfig.model_validate({})
+
+    monkeypatch.setenv("NOVA_CONFIG__JSON_ITEMS", '["x", {"y": 1}]')
+    monkeypatch.setenv("NOVA_CONFIG__YAML_ITEMS", "[x, y]")
+    monkeypatch.setenv("NOVA_CONFIG__YAML_MAPPING", "{key: value}")
+
+    data = apply_env_overrides(base).model_dump()
+
+    assert data["json_items"] == ["x", {"y": 1}]
+    assert data["yaml_items"] == ["x", "y"]
+    assert data["yaml_mapping"] == {"key": "value"}
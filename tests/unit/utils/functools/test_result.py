@@ -5,9 +5,22 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from nova.utils.functools.models import Err, Ok, OkErr, Result, UnwrapError, as_async_result, as_result
+from nova.utils.functools.models import (
+    Err,
+    Ok,
+    OkErr,
+    Result,
+    UnwrapError,
+    as_async_result,
+    as_result,
+    do,
+    identity,
+    partition,
+)
 
 
 def test_ok_factories() -> None:
@@ -63,6 +76,13 @@ def test_err_value() -> None:
     assert res.err_value == "haha"
 
 
+def test_result_values_are_read_only() -> None:
+    with pytest.raises(AttributeError):
+        Ok(1).ok_value = 2  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        Err(1).err_value = 2  # type: ignore[misc]
+
+
 def test_ok() -> None:
     res = Ok("haha")
     assert res.is_ok() is True
@@ -277,6 +297,23 @@ async def test_map_async() -> None:
     assert (await errnum.map_async(str_async)).err() == 2
 
 
+@pytest.mark.asyncio
+async def test_async_methods_return_coroutines_for_ok_and_err() -> None:
+    async def str_async(x: int) -> str:
+        return str(x)
+
+    task = asyncio.create_task(Err(1).map_async(str_async))
+    assert await task == Err(1)
+
+    results = await asyncio.gather(
+        Ok(2).map_async(str_async),
+        Err(3).map_async(str_async),
+        Ok(4).and_then_async(sq_async),
+        Err(5).and_then_async(sq_async),
+    )
+    assert results == [Ok("2"), Err(3), Ok(16), Err(5)]
+
+
 def test_or_else() -> None:
     assert Ok(2).or_else(sq).or_else(sq).ok() == 2
     assert Ok(2).or_else(to_err).or_else(sq).ok() == 2
@@ -317,6 +354,50 @@ def test_error_context() -> None:
         n.unwrap()
     exc = exc_info.value
     assert exc.result is n
+    assert str(exc) == "Called `Result.unwrap()` on an `Err` value: 'nay'"
+    assert exc.args == ("Called `Result.unwrap()` on an `Err` value: 'nay'",)
+
+    with pytest.raises(UnwrapError, match=r"^failed: 'nay'$"):
+        n.expect("failed")
+
+
+def test_identity_map_returns_same_instance() -> None:
+    o = Ok(1)
+    n = Err(2)
+    assert o.map(identity) is o
+    assert n.map_err(identity) is n
+    assert o.map_err(identity) is o
+    assert n.map(identity) is n
+
+
+def test_rewrapping_constructor_returns_same_instance() -> None:
+    o = Ok(1)
+    n = Err(2)
+    assert o.and_then(Ok) is o
+    assert n.or_else(Err) is n
+
+
+def test_do_short_circuits_on_err() -> None:
+    ok: Result[int, str] = do(Ok(x + y) for x in Ok(1) for y in Ok(2))
+    err: Result[int, str] = do(Ok(x + y) for x in Ok(1) for y in Err("boom"))
+    assert ok == Ok(3)
+    assert err == Err("boom")
+
+
+def test_partition_splits_values_in_order() -> None:
+    results: list[Result[int, str]] = [Ok(1), Err("a"), Ok(2), Err("b")]
+    assert partition(results) == ([1, 2], ["a", "b"])
+    assert partition([]) == ([], [])
+
+
+async def test_do_rejects_async_generator() -> None:
+    async def get_one() -> Result[int, str]:
+        return Ok(1)
+
+    gen = (Ok(x + y) for x in await get_one() for y in await get_one())
+    with pytest.raises(TypeError, match="Got async_generator but expected generator"):
+        do(gen)  # type: ignore[arg-type]
+    await gen.aclose()
 
 
 def test_slots() -> None:
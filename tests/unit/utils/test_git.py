@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -18,41 +19,66 @@ from nova.utils.git import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_git_caches() -> Iterator[None]:
+    is_git_installed.cache_clear()
+    get_git_version.cache_clear()
+    yield
+    is_git_installed.cache_clear()
+    get_git_version.cache_clear()
+
+
 class TestIsGitInstalled:
     """Tests for is_git_installed() function."""
 
-    def test_returns_true_when_git_is_available(self) -> None:
-        """Test that is_git_installed returns True when git command succeeds."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-
+    def test_returns_true_when_git_is_on_path(self) -> None:
+        """Test that is_git_installed returns True when git is found on PATH."""
+        with patch("shutil.which", return_value="/usr/bin/git") as mock_which:
             result = is_git_installed()
 
             assert result is True
-            mock_run.assert_called_once_with(
-                ["git", "--version"],
-                capture_output=True,
-                check=True,
-            )
+            mock_which.assert_called_once_with("git")
 
     def test_returns_false_when_git_not_found(self) -> None:
-        """Test that is_git_installed returns False when git is not found."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        """Test that is_git_installed returns False when git is not on PATH."""
+        with patch("shutil.which", return_value=None):
             result = is_git_installed()
 
             assert result is False
 
-    def test_returns_false_when_git_command_fails(self) -> None:
-        """Test that is_git_installed returns False when git command fails."""
-        with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "git")):
-            result = is_git_installed()
+    def test_does_not_spawn_a_process(self) -> None:
+        """Test that is_git_installed only looks up PATH."""
+        with patch("shutil.which", return_value="/usr/bin/git"), patch("subprocess.run") as mock_run:
+            is_git_installed()
 
-            assert result is False
+            mock_run.assert_not_called()
+
+    def test_caches_lookup(self) -> None:
+        """Test that repeated calls only look up PATH once."""
+        with patch("shutil.which", return_value="/usr/bin/git") as mock_which:
+            assert is_git_installed() is True
+            assert is_git_installed() is True
+
+            mock_which.assert_called_once()
 
 
 class TestGetGitVersion:
     """Tests for get_git_version() function."""
 
+    @pytest.fixture(autouse=True)
+    def git_on_path(self) -> Iterator[None]:
+        with patch("shutil.which", return_value="/usr/bin/git"):
+            yield
+
+    def test_returns_err_without_spawning_when_git_not_on_path(self) -> None:
+        """Test that get_git_version skips the subprocess when git is not on PATH."""
+        with patch("shutil.which", return_value=None), patch("subprocess.run") as mock_run:
+            result = get_git_version()
+
+            assert is_err(result)
+            assert isinstance(result.unwrap_err(), GitNotInstalledError)
+            mock_run.assert_not_called()
+
     def test_returns_version_string_when_successful(self) -> None:
         """Test that get_git_version returns Ok with version string."""
         with patch("subprocess.run") as mock_run:
@@ -87,6 +113,17 @@ class TestGetGitVersion:
             assert match is not None
             assert result.unwrap() == match.group(1)
 
+    def test_caches_result(self) -> None:
+        """Test that repeated calls only run git once."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="git version 2.39.2\n", returncode=0)
+
+            first = get_git_version()
+            second = get_git_version()
+
+            assert first is second
+            mock_run.assert_called_once()
+
     def test_returns_err_when_git_not_installed(self) -> None:
         """Test that get_git_version returns GitNotInstalledError when git not found."""
         with patch("subprocess.run", side_effect=FileNotFoundError):
@@ -139,7 +176,8 @@ class TestCloneRepository:
             assert result.unwrap() == destination
             mock_run.assert_called_once_with(
                 ["git", "clone", "--depth", "1", url, str(destination)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
             )
@@ -157,7 +195,8 @@ class TestCloneRepository:
             assert is_ok(result)
             mock_run.assert_called_once_with(
                 ["git", "clone", "--depth", "5", url, str(destination)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
             )